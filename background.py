@@ -1,22 +1,79 @@
 import os
+import bisect
 import random
-from moviepy.editor import *
-from moviepy.video.fx import resize, fadein, fadeout
-from moviepy.video.fx.all import colorx
+import hashlib
+import logging
+import multiprocessing
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 from datetime import datetime
 import argparse
 
+from ffmpegUtils import detect_h264_encoder, encoder_args, keyframe_times, probe_video, run_ffmpeg
+
+log = logging.getLogger(__name__)
+
+# Channel gain of each aesthetic effect (MoviePy's colorx factor)
+EFFECT_GAINS = {
+    'cinematic': 0.9,  # Slight desaturation
+    'warm': 1.1,       # Slight saturation boost
+    'cool': 0.8        # Desaturated
+}
+
+def vignette_mask(h, w):
+    """
+    Get the vignette mask for a frame size
+    
+    Returns:
+        uint8 array of shape (h, w), 255 = unchanged
+    """
+    Y, X = np.ogrid[:h, :w]
+    center_x, center_y = w/2, h/2
+    dist = np.sqrt((X - center_x)**2 + (Y - center_y)**2)
+    mask = 1 - dist / dist.max() * 0.3  # Subtle vignette
+    mask = np.clip(mask, 0.7, 1)
+    return np.rint(mask * 255).astype(np.uint8)
+
+def _init_segment_worker(log_level):
+    """Pool initializer: spawned workers start without logging set up"""
+    logging.basicConfig(level=log_level, format='%(message)s', stream=sys.stdout)
+
+def write_vignette_mask(path, h, w):
+    """Save the vignette mask as a binary PGM image, which ffmpeg reads as a gray frame"""
+    with open(path, 'wb') as f:
+        f.write(f"P5\n{w} {h}\n255\n".encode('ascii'))
+        f.write(vignette_mask(h, w).tobytes())
+    return path
+
 class InstagramBGCreator:
-    def __init__(self, stock_folder="StockVideos", output_folder="output"):
+    def __init__(self, stock_folder="StockVideos", output_folder="output", encoder=None,
+                 max_workers=None, use_cache=True, cache_folder=None, hwaccel=None):
         self.stock_folder = stock_folder
         self.output_folder = output_folder
+        # Rendered segments are reused across runs when the same inputs come up again
+        self.use_cache = use_cache
+        self.cache_folder = cache_folder or os.path.join(output_folder, "cache")
+        # ffmpeg is already multi-threaded per clip, so use half the cores for segments
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        # Hardware encoder (NVENC/QSV/AMF/VideoToolbox) when available, libx264 otherwise
+        self.encoder = encoder or detect_h264_encoder()
+        # Optional hardware decoder for stock footage (e.g. 'cuda', 'qsv', 'auto')
+        self.hwaccel = hwaccel
         self.target_width = 1080
         self.target_height = 1920  # 9:16 aspect ratio
         self.supported_formats = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+        # Scratch folder of the render in progress; create_background_video
+        # makes it and removes it again
+        self.temp_folder = None
+        self._keyframes = {}
         
         # Create output folder if it doesn't exist
         os.makedirs(output_folder, exist_ok=True)
+        if use_cache:
+            os.makedirs(self.cache_folder, exist_ok=True)
     
     def get_video_files(self):
         """Get all video files from the stock folder"""
@@ -34,13 +91,11 @@ class InstagramBGCreator:
         
         return video_files
     
-    def crop_to_vertical(self, clip):
+    def crop_to_vertical(self, w, h):
         """
-        Crop video to 9:16 aspect ratio maintaining quality
-        Uses center crop with option to focus on most interesting part
+        Build the ffmpeg filter that crops video to 9:16 aspect ratio maintaining quality
+        Uses center crop, then scales to the exact Instagram dimensions in ffmpeg
         """
-        w, h = clip.w, clip.h
-        
         # Calculate target dimensions based on current video
         if w / h > 9/16:  # Video is too wide
             # Crop width, keep full height
@@ -48,110 +103,237 @@ class InstagramBGCreator:
             x_center = w // 2
             x1 = max(0, x_center - new_width // 2)
             x2 = min(w, x1 + new_width)
-            clip = clip.crop(x1=x1, x2=x2)
+            crop = f"crop={x2 - x1}:{h}:{x1}:0"
         else:  # Video is too tall or perfect ratio
             # Crop height, keep full width  
             new_height = int(w * 16/9)
             y_center = h // 2
             y1 = max(0, y_center - new_height // 2)
             y2 = min(h, y1 + new_height)
-            clip = clip.crop(y1=y1, y2=y2)
+            crop = f"crop={w}:{y2 - y1}:0:{y1}"
         
         # Resize to exact Instagram dimensions
-        clip = clip.resize((self.target_width, self.target_height))
-        return clip
+        return f"{crop},scale={self.target_width}:{self.target_height}:flags=lanczos,setsar=1"
     
-    def add_aesthetic_effects(self, clip, effect_type="subtle"):
+    def effect_filter_graph(self, crop_filter, effect_type="subtle"):
         """
-        Add aesthetic effects to enhance the video
+        Build the ffmpeg filter graph that crops a clip and adds an aesthetic effect
+        
+        The color gain and the vignette run in the same ffmpeg pass as the
+        crop, so a segment is decoded and encoded once. The cinematic vignette
+        multiplies the frame with the mask image passed as the second input.
+        
+        Returns:
+            filter_complex string with its output labelled [out]
         """
+        chain = f"[0:v]{crop_filter},fps=30"
+        gain = EFFECT_GAINS.get(effect_type)
+        if gain:
+            chain += f",format=gbrp,colorchannelmixer=rr={gain}:gg={gain}:bb={gain}"
         if effect_type == "cinematic":
-            # Slightly desaturated, film-like look
-            clip = clip.fx(colorx, 0.9)  # Slight desaturation
-            # Add subtle vignette effect using a mask
-            def vignette(get_frame, t):
-                frame = get_frame(t)
-                h, w = frame.shape[:2]
-                
-                # Create vignette mask
-                Y, X = np.ogrid[:h, :w]
-                center_x, center_y = w/2, h/2
-                mask = np.sqrt((X - center_x)**2 + (Y - center_y)**2)
-                mask = mask / mask.max()
-                mask = 1 - mask * 0.3  # Subtle vignette
-                mask = np.clip(mask, 0.7, 1)
-                
-                # Apply vignette
-                if len(frame.shape) == 3:
-                    mask = mask[:, :, np.newaxis]
-                return frame * mask
-            
-            clip = clip.fl(vignette, apply_to=['mask'])
-            
-        elif effect_type == "warm":
-            # Warm, cozy feeling
-            clip = clip.fx(colorx, 1.1)  # Slight saturation boost
-            
-        elif effect_type == "cool":
-            # Cool, modern feeling
-            clip = clip.fx(colorx, 0.8)  # Desaturated
-            
-        return clip
+            return (f"{chain}[graded];[1:v]format=gbrp[mask];"
+                    f"[graded][mask]blend=all_mode=multiply,format=yuv420p[out]")
+        return f"{chain},format=yuv420p[out]"
+    
+    @property
+    def vignette_path(self):
+        """Vignette mask image, written once per run by create_background_video"""
+        return os.path.join(self.temp_folder, f"vignette_{self.target_width}x{self.target_height}.pgm")
     
-    def create_smooth_transition(self, clip1, clip2, transition_duration=1.0, transition_type="crossfade"):
+    def create_smooth_transition(self, transition_duration=1.0, transition_type="crossfade"):
         """
-        Create smooth transitions between clips
+        Get the ffmpeg xfade transition used between two clips
+        
+        Returns:
+            (xfade transition name, transition duration in seconds)
         """
-        if transition_type == "crossfade":
-            # Standard crossfade
-            clip1 = clip1.fadeout(transition_duration)
-            clip2 = clip2.fadein(transition_duration)
-            
-        elif transition_type == "slide":
-            # Slide transition (more complex, simplified version)
-            clip1 = clip1.fadeout(transition_duration * 0.5)
-            clip2 = clip2.fadein(transition_duration * 0.5)
+        if transition_type == "slide":
+            # Next clip pushes the previous one out to the left
+            return "slideleft", transition_duration
             
-        elif transition_type == "zoom":
+        if transition_type == "zoom":
             # Subtle zoom effect during transition
-            zoom_factor = 1.1
-            clip1_end = clip1.fx(resize, lambda t: 1 + (zoom_factor-1) * t/clip1.duration)
-            clip1 = clip1_end.fadeout(transition_duration)
-            clip2 = clip2.fadein(transition_duration)
+            return "zoomin", transition_duration
         
-        return clip1, clip2
+        # Standard crossfade
+        return "fade", transition_duration
     
-    def process_clip(self, video_path, segment_duration, start_time=None, effect_type="subtle"):
+    def build_filter_graph(self, durations, duration, transition_duration, transition_type):
         """
-        Process individual video clip
+        Build the xfade filter graph that joins all segments into the final video
+        
+        Args:
+            durations: Duration of each input segment in seconds
+            duration: Requested total duration of the final video
+            transition_duration: Duration of transitions between clips
+            transition_type: Type of transition ('crossfade', 'slide', 'zoom')
+            
+        Returns:
+            (filter_complex string, final video duration)
+        """
+        transition, overlap = self.create_smooth_transition(transition_duration, transition_type)
+        
+        filters = []
+        last_label = "0:v"
+        total = durations[0]
+        for i in range(1, len(durations)):
+            # Each transition starts `overlap` seconds before the current end
+            offset = max(0, total - overlap)
+            label = f"v{i}"
+            filters.append(
+                f"[{last_label}][{i}:v]xfade=transition={transition}:"
+                f"duration={overlap:.3f}:offset={offset:.3f}[{label}]"
+            )
+            last_label = label
+            total = offset + durations[i]
+        
+        # Trim to exact duration, fade in the first clip and fade out the end
+        final_duration = min(duration, total)
+        filters.append(
+            f"[{last_label}]trim=duration={final_duration:.3f},"
+            f"fade=t=in:st=0:d=0.5,"
+            f"fade=t=out:st={max(0, final_duration - 0.5):.3f}:d=0.5,"
+            f"format=yuv420p[out]"
+        )
+        return ";".join(filters), final_duration
+    
+    def process_clip(self, video_path, segment_duration, output_path, start_time=None,
+                     effect_type="subtle"):
+        """
+        Cut, crop, scale and color one clip into a finished segment in a single ffmpeg run
+        
+        Returns:
+            output_path, or None on failure
         """
         try:
-            # Load video
-            clip = VideoFileClip(video_path)
+            # Read duration/size from the container header only
+            duration, w, h = probe_video(video_path)
             
             # If start_time not specified, pick random start point
             if start_time is None:
-                max_start = max(0, clip.duration - segment_duration)
+                max_start = max(0, duration - segment_duration)
                 start_time = random.uniform(0, max_start) if max_start > 0 else 0
             
-            # Extract segment
-            end_time = min(start_time + segment_duration, clip.duration)
-            clip = clip.subclip(start_time, end_time)
-            
-            # Crop to 9:16
-            clip = self.crop_to_vertical(clip)
-            
-            # Add aesthetic effects
-            clip = self.add_aesthetic_effects(clip, effect_type)
-            
-            # Ensure consistent framerate
-            clip = clip.set_fps(30)
-            
-            return clip
+            end_time = min(start_time + segment_duration, duration)
+            # Keyframe-aligned starts need no accurate (decode-and-discard) seek
+            seek_args = ['-ss', f"{start_time:.3f}"]
+            if start_time in self._keyframes.get(video_path, ()):
+                seek_args.append('-noaccurate_seek')
+            inputs = seek_args + ['-t', f"{end_time - start_time:.3f}", '-i', video_path]
+            if effect_type == "cinematic":
+                inputs += ['-i', self.vignette_path]
+            cut_args = inputs + [
+                '-filter_complex', self.effect_filter_graph(self.crop_to_vertical(w, h), effect_type),
+                '-map', '[out]',
+                '-an'
+            ] + self.segment_encoder_args() + [output_path]
+            if self.hwaccel:
+                try:
+                    # Decode on the GPU; frames are downloaded for the crop/scale
+                    run_ffmpeg(['-hwaccel', self.hwaccel] + cut_args)
+                except RuntimeError as e:
+                    log.warning(f"Hardware decoding failed for {video_path}, using software: {e}")
+                    run_ffmpeg(cut_args)
+            else:
+                run_ffmpeg(cut_args)
+            return output_path
             
         except Exception as e:
-            print(f"Error processing {video_path}: {e}")
+            log.error(f"Error processing {video_path}: {e}")
+            return None
+    
+    def segment_encoder_args(self):
+        """
+        Encoder arguments shared by every segment; the fixed GOP keeps their
+        stream layout identical for concat copy
+        """
+        return encoder_args(self.encoder, quality=18) + ['-g', '30']
+    
+    def get_keyframes(self, video_path):
+        """Keyframe timestamps for a video, probed once per file"""
+        if video_path not in self._keyframes:
+            self._keyframes[video_path] = keyframe_times(video_path)
+        return self._keyframes[video_path]
+    
+    def pick_start_time(self, video_path, segment_duration):
+        """
+        Pick a random start point, snapped back to the previous keyframe
+        Seeking to a keyframe avoids decoding throwaway frames and keeps
+        start points repeatable so segments can be cached
+        """
+        duration = probe_video(video_path)[0]
+        max_start = max(0, duration - segment_duration)
+        start_time = random.uniform(0, max_start) if max_start > 0 else 0.0
+        
+        keyframes = self.get_keyframes(video_path)
+        index = bisect.bisect_right(keyframes, start_time)
+        if index:
+            return keyframes[index - 1]
+        # No keyframe info (ffprobe missing), fall back to whole seconds
+        return float(int(start_time))
+    
+    def segment_cache_path(self, video_path, start_time, segment_duration, effect_type):
+        """
+        Cache location for a rendered segment, keyed on everything that affects
+        its pixels and its stream layout; hardcut runs concat segments without
+        re-encoding, so segments from another encoder or settings must not mix
+        """
+        mtime = os.path.getmtime(video_path)
+        key = hashlib.blake2b(
+            f"{os.path.abspath(video_path)}|{mtime}|{start_time:.3f}|{segment_duration:.3f}|"
+            f"{effect_type}|{self.target_width}x{self.target_height}|"
+            f"{' '.join(self.segment_encoder_args())}".encode()
+        ).hexdigest()[:16]
+        return os.path.join(self.cache_folder, f"{key}.mp4")
+    
+    def render_segment(self, video_path, segment_duration, segment_path, effect_type="subtle"):
+        """
+        Process a clip and write it to disk as a finished segment
+        Runs in a worker process, so it returns the path rather than a MoviePy clip
+        """
+        try:
+            start_time = self.pick_start_time(video_path, segment_duration)
+        except Exception as e:
+            log.error(f"Error processing {video_path}: {e}")
+            return None
+        
+        if self.use_cache:
+            segment_path = self.segment_cache_path(
+                video_path, start_time, segment_duration, effect_type
+            )
+            if os.path.exists(segment_path):
+                return segment_path
+        
+        # Write under a temporary name so an interrupted render never looks cached
+        partial_path = segment_path[:-len(".mp4")] + ".partial.mp4"
+        if not self.process_clip(video_path, segment_duration, partial_path,
+                                 start_time=start_time, effect_type=effect_type):
             return None
+        os.replace(partial_path, segment_path)
+        return segment_path
+    
+    def concat_segments(self, segment_paths, duration, output_path):
+        """
+        Join segments back to back with ffmpeg's concat demuxer, copying the streams
+        
+        Returns:
+            Final video duration in seconds
+        """
+        list_path = os.path.join(self.temp_folder, "segments.txt")
+        with open(list_path, 'w', encoding='utf-8') as f:
+            for path in segment_paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        
+        final_duration = min(duration, sum(probe_video(path)[0] for path in segment_paths))
+        run_ffmpeg([
+            '-f', 'concat', '-safe', '0', '-i', list_path,
+            '-c', 'copy',
+            '-t', f"{final_duration:.3f}",
+            '-movflags', '+faststart',
+            output_path
+        ])
+        return final_duration
     
     def create_background_video(self, duration=60, num_clips=None, effect_type="cinematic", 
                               transition_duration=1.5, transition_type="crossfade", 
@@ -164,111 +346,114 @@ class InstagramBGCreator:
             num_clips: Number of clips to use (if None, auto-calculate)
             effect_type: Type of aesthetic effect ('subtle', 'cinematic', 'warm', 'cool')
             transition_duration: Duration of transitions between clips
-            transition_type: Type of transition ('crossfade', 'slide', 'zoom')
+            transition_type: Type of transition ('crossfade', 'slide', 'zoom', 'hardcut')
             output_name: Custom output filename
         """
         
         video_files = self.get_video_files()
-        print(f"Found {len(video_files)} video files")
-        
-        # Calculate number of clips needed
-        if num_clips is None:
-            # Estimate: each clip ~8-12 seconds with transitions
-            avg_clip_duration = 10
-            num_clips = max(3, int(duration / avg_clip_duration))
-        
-        num_clips = min(num_clips, len(video_files))  # Can't use more clips than available
-        
-        # Select random videos
-        selected_videos = random.sample(video_files, num_clips)
-        segment_duration = duration / num_clips + transition_duration  # Overlap for transitions
-        
-        print(f"Creating {duration}s video using {num_clips} clips...")
-        print(f"Effect: {effect_type}, Transition: {transition_type}")
-        
-        clips = []
+        log.info(f"Found {len(video_files)} video files")
+        self.temp_folder = tempfile.mkdtemp(prefix="bg_temp_")
         
-        # Process each clip
-        for i, video_path in enumerate(selected_videos):
-            print(f"Processing clip {i+1}/{num_clips}: {os.path.basename(video_path)}")
+        try:
+            # Calculate number of clips needed
+            if num_clips is None:
+                # Estimate: each clip ~8-12 seconds with transitions
+                avg_clip_duration = 10
+                num_clips = max(3, int(duration / avg_clip_duration))
             
-            clip = self.process_clip(
-                video_path, 
-                segment_duration, 
-                effect_type=effect_type
-            )
+            num_clips = min(num_clips, len(video_files))  # Can't use more clips than available
             
-            if clip:
-                clips.append(clip)
-            else:
-                print(f"Skipping problematic clip: {video_path}")
-        
-        if not clips:
-            raise ValueError("No clips could be processed successfully!")
-        
-        # Create transitions and concatenate
-        final_clips = []
-        
-        for i, clip in enumerate(clips):
-            if i == 0:
-                # First clip - just fade in
-                clip = clip.fadein(0.5)
-                final_clips.append(clip)
+            # Select random videos
+            selected_videos = random.sample(video_files, num_clips)
+            segment_duration = duration / num_clips
+            if transition_type != "hardcut":
+                segment_duration += transition_duration  # Overlap for transitions
+            
+            log.info(f"Creating {duration}s video using {num_clips} clips...")
+            log.info(f"Effect: {effect_type}, Transition: {transition_type}")
+            
+            # Render each clip to a segment file in parallel worker processes
+            segment_paths = [None] * num_clips
+            # Every worker blends the same vignette image, so write it once up front
+            if effect_type == "cinematic":
+                write_vignette_mask(self.vignette_path, self.target_height, self.target_width)
+            # Spawned rather than forked: the pipeline may be running Kokoro/torch
+            # on another thread of this process, and forked children would
+            # inherit its held locks and CUDA state
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, num_clips),
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_segment_worker,
+                                     initargs=(logging.getLogger().getEffectiveLevel(),)) as executor:
+                futures = {
+                    executor.submit(
+                        self.render_segment,
+                        video_path,
+                        segment_duration,
+                        os.path.join(self.temp_folder, f"seg_{i}.mp4"),
+                        effect_type
+                    ): i
+                    for i, video_path in enumerate(selected_videos)
+                }
+            
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    segment_paths[i] = future.result()
+                    video_name = os.path.basename(selected_videos[i])
+                    if segment_paths[i]:
+                        log.info(f"Processed clip {done}/{num_clips}: {video_name}")
+                    else:
+                        log.warning(f"Skipping problematic clip: {selected_videos[i]}")
+            
+            segment_paths = [path for path in segment_paths if path]
+            
+            if not segment_paths:
+                raise ValueError("No clips could be processed successfully!")
+            
+            # Generate output filename
+            if output_name is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_name = f"instagram_bg_{effect_type}_{duration}s_{timestamp}.mp4"
+            
+            if not output_name.endswith('.mp4'):
+                output_name += '.mp4'
+            
+            output_path = os.path.join(self.output_folder, output_name)
+            
+            if transition_type == "hardcut":
+                # Segments share encoder settings, so they can be joined without re-encoding
+                log.info(f"Joining segments into {output_path} (stream copy)...")
+                final_duration = self.concat_segments(segment_paths, duration, output_path)
             else:
-                # Apply transition with previous clip
-                prev_clip = final_clips[-1]
-                prev_clip, clip = self.create_smooth_transition(
-                    prev_clip, clip, transition_duration, transition_type
+                # Create transitions between clips in a single ffmpeg filter graph
+                durations = [probe_video(path)[0] for path in segment_paths]
+                filter_graph, final_duration = self.build_filter_graph(
+                    durations, duration, transition_duration, transition_type
                 )
-                final_clips[-1] = prev_clip  # Update previous clip
-                final_clips.append(clip)
-        
-        # Concatenate all clips
-        print("Concatenating clips...")
-        final_video = concatenate_videoclips(final_clips, method="compose")
-        
-        # Trim to exact duration and add final fade out
-        final_video = final_video.subclip(0, min(duration, final_video.duration))
-        final_video = final_video.fadeout(0.5)
-        
-        # Generate output filename
-        if output_name is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_name = f"instagram_bg_{effect_type}_{duration}s_{timestamp}.mp4"
-        
-        if not output_name.endswith('.mp4'):
-            output_name += '.mp4'
-        
-        output_path = os.path.join(self.output_folder, output_name)
-        
-        # Export with optimized settings for Instagram
-        print(f"Exporting to {output_path}...")
-        final_video.write_videofile(
-            output_path,
-            fps=30,
-            codec='libx264',
-            audio_codec='aac',
-            temp_audiofile='temp-audio.m4a',
-            remove_temp=True,
-            preset='medium',
-            ffmpeg_params=[
-                '-crf', '23',  # Good quality
-                '-pix_fmt', 'yuv420p',  # Instagram compatibility
-                '-movflags', '+faststart'  # Web optimization
-            ]
-        )
-        
-        # Clean up
-        final_video.close()
-        for clip in clips:
-            clip.close()
-        
-        print(f"✅ Background video created successfully: {output_path}")
-        print(f"Duration: {duration}s, Resolution: {self.target_width}x{self.target_height}")
+            
+                # Export with optimized settings for Instagram
+                log.info(f"Exporting to {output_path} ({self.encoder})...")
+                inputs = []
+                for path in segment_paths:
+                    inputs += ['-i', path]
+                run_ffmpeg(inputs + [
+                    '-filter_complex', filter_graph,
+                    '-map', '[out]',
+                    '-r', '30'
+                ] + encoder_args(self.encoder) + [
+                    '-movflags', '+faststart',  # Web optimization
+                    output_path
+                ])
+        finally:
+            # Clean up, including the full-resolution cuts of a failed run
+            shutil.rmtree(self.temp_folder, ignore_errors=True)
+        
+        log.info(f"✅ Background video created successfully: {output_path}")
+        log.info(f"Duration: {final_duration:.1f}s, Resolution: {self.target_width}x{self.target_height}")
         
         return output_path
 
 def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     parser = argparse.ArgumentParser(description="Create Instagram reel background videos")
     parser.add_argument("--duration", "-d", type=int, default=60, 
                        help="Duration of output video in seconds (default: 60)")
@@ -276,7 +461,7 @@ def main():
                        help="Number of clips to use (default: auto)")
     parser.add_argument("--effect", "-e", choices=['subtle', 'cinematic', 'warm', 'cool'], 
                        default='cinematic', help="Aesthetic effect type")
-    parser.add_argument("--transition", "-t", choices=['crossfade', 'slide', 'zoom'],
+    parser.add_argument("--transition", "-t", choices=['crossfade', 'slide', 'zoom', 'hardcut'],
                        default='crossfade', help="Transition type")
     parser.add_argument("--transition-duration", type=float, default=1.5,
                        help="Transition duration in seconds")
@@ -284,12 +469,22 @@ def main():
                        help="Folder containing stock videos")
     parser.add_argument("--output", "-o", default=None,
                        help="Output filename")
-    
+    parser.add_argument("--workers", type=int, default=None,
+                       help="Parallel clip workers (default: half the CPU cores)")
+    parser.add_argument("--no-cache", action='store_true',
+                       help="Re-render every segment instead of reusing cached ones")
+    parser.add_argument("--encoder", default=None,
+                       help="H.264 encoder (default: auto-detect, e.g. h264_nvenc, libx264)")
+    parser.add_argument("--hwaccel", choices=['auto', 'cuda', 'qsv', 'videotoolbox'], default=None,
+                       help="Hardware decoder for stock footage (default: software decoding)")
+
     args = parser.parse_args()
     
     try:
         # Create background video generator
-        bg_creator = InstagramBGCreator(stock_folder=args.stock_folder)
+        bg_creator = InstagramBGCreator(stock_folder=args.stock_folder, encoder=args.encoder,
+                                        max_workers=args.workers,
+                                        use_cache=not args.no_cache, hwaccel=args.hwaccel)
         
         # Generate background video
         output_path = bg_creator.create_background_video(
@@ -1,16 +1,115 @@
-import praw
 import json
 import csv
-import time
 from datetime import datetime
+import logging
 import re
 import os
-import dotenv
-# Load environment variables from .env file
-dotenv.load_dotenv()
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster JSON writing, stdlib json otherwise
+
+log = logging.getLogger(__name__)
+
+# ASCII whitespace lookup table for byte-level word counting (what str.split() splits on)
+_IS_SPACE = np.zeros(256, dtype=bool)
+_IS_SPACE[[c for c in range(128) if chr(c).isspace()]] = True
+
+def count_words(text):
+    """
+    Count whitespace-separated words, as len(text.split()) does, without
+    building a list of substrings for ASCII text
+    
+    Args:
+        text: Text content to analyze
+        
+    Returns:
+        Number of words
+    """
+    if not text.isascii():
+        # NBSP, em spaces etc. separate words too, which the byte table misses
+        return len(text.split())
+    data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    if not data.size:
+        return 0
+    is_space = _IS_SPACE[data]
+    # A word starts wherever a non-space byte follows a space (or the start)
+    starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    return int(starts) + (not is_space[0])
+
+def write_json(data, filename):
+    """Write data as indented UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+# Column order for scraped posts (also the CSV header)
+POST_FIELDS = (
+    'title', 'content', 'full_text', 'author', 'score', 'url',
+    'created_utc', 'reading_time_seconds', 'subreddit', 'id'
+)
+
+# Columnar layout of the fields posts are ranked by; the text stays in the dicts
+POST_DTYPE = np.dtype([('score', 'i4'), ('reading_time_seconds', 'f4')])
+
+def to_structured(posts):
+    """Pack the ranking fields of posts into a NumPy structured array, one column per field"""
+    return np.array([(post['score'], post['reading_time_seconds']) for post in posts],
+                    dtype=POST_DTYPE)
+
+def rank_posts(posts, keep=None, target_time=90):
+    """
+    Order posts by score, then by closeness to the target reading time
+    
+    Args:
+        posts: List of post dicts
+        keep: Return only this many of the best posts (default: all)
+        target_time: Ideal reading time in seconds
+        
+    Returns:
+        The ranked post dicts
+    """
+    if not posts:
+        return []
+    stats = to_structured(posts)
+    neg_score = -stats['score']
+    distance = np.abs(stats['reading_time_seconds'] - target_time)
+    if keep is not None and keep < len(posts):
+        # Only the best `keep` need sorting: partition on score in O(N) and
+        # keep every post tied with the cut-off score for the tie-break
+        cutoff = np.partition(neg_score, keep - 1)[keep - 1]
+        candidates = np.flatnonzero(neg_score <= cutoff)
+    else:
+        candidates = np.arange(len(posts))
+    order = candidates[np.lexsort((distance[candidates], neg_score[candidates]))]
+    return [posts[i] for i in order[:keep]]
 
 class RedditMotivationalScraper:
-    def __init__(self, client_id, client_secret, user_agent):
+    # All Reddit markdown we strip, matched in a single left-to-right scan.
+    # Bold-italic must come before bold, and bold before italic, so '***' and
+    # '**' are not read as shorter markers with a stray '*' left over.
+    _RE_MARKDOWN = re.compile(
+        r'\*\*\*(?P<bolditalic>.*?)\*\*\*'
+        r'|\*\*(?P<bold>.*?)\*\*'
+        r'|\*(?P<italic>.*?)\*'
+        r'|~~(?P<strike>.*?)~~'
+        r'|\[(?P<link>.*?)\]\(.*?\)'
+        r'|&(?P<entity>gt|lt|amp);'
+        r'|(?P<newlines>\n+)'
+    )
+    _ENTITIES = {'gt': '>', 'lt': '<', 'amp': '&'}
+    # Concurrent Reddit clients sharing one API quota
+    MAX_FETCH_THREADS = 4
+    
+    def __init__(self, client_id, client_secret, user_agent, max_workers=4):
         """
         Initialize the Reddit scraper with API credentials
         
@@ -18,12 +117,38 @@ class RedditMotivationalScraper:
             client_id: Reddit API client ID
             client_secret: Reddit API client secret
             user_agent: User agent string for API requests
+            max_workers: Subreddits fetched concurrently (capped at MAX_FETCH_THREADS)
         """
-        self.reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent
-        )
+        import praw
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        # One keep-alive session shared by every thread's Reddit instance, so
+        # concurrent fetches reuse pooled TLS connections instead of new handshakes
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max(10, max_workers))
+        self._session.mount('https://', adapter)
+        
+        self._credentials = {
+            'client_id': client_id,
+            'client_secret': client_secret,
+            'user_agent': user_agent,
+            'requestor_kwargs': {'session': self._session}
+        }
+        self.reddit = praw.Reddit(**self._credentials)
+        self.max_workers = max_workers
+        self._local = threading.local()
+    
+    def _get_reddit(self):
+        """Reddit instance for the calling thread (PRAW is not thread-safe)"""
+        if threading.current_thread() is threading.main_thread():
+            return self.reddit
+        
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            import praw
+            reddit = self._local.reddit = praw.Reddit(**self._credentials)
+        return reddit
         
     def estimate_reading_time(self, text, wpm=200):
         """
@@ -36,7 +161,7 @@ class RedditMotivationalScraper:
         Returns:
             Reading time in seconds
         """
-        word_count = len(text.split())
+        word_count = count_words(text)
         reading_time_minutes = word_count / wpm
         return reading_time_minutes * 60
     
@@ -51,21 +176,24 @@ class RedditMotivationalScraper:
             Cleaned text
         """
         # Remove Reddit markdown and special characters
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*(.*?)\*', r'\1', text)      # Italic
-        text = re.sub(r'~~(.*?)~~', r'\1', text)      # Strikethrough
-        text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', text)  # Links
-        text = re.sub(r'&gt;', '>', text)             # Quote markers
-        text = re.sub(r'&lt;', '<', text)
-        text = re.sub(r'&amp;', '&', text)
-        text = re.sub(r'\n+', ' ', text)              # Multiple newlines
+        text = self._RE_MARKDOWN.sub(self._replace_markdown, text)
         text = text.strip()
         return text
     
-    def scrape_subreddit(self, subreddit_name, limit=50, time_filter='week', 
-                        min_time=60, max_time=120):
+    def _replace_markdown(self, match):
+        """Replacement for one _RE_MARKDOWN match"""
+        kind = match.lastgroup
+        if kind == 'entity':
+            return self._ENTITIES[match.group('entity')]
+        if kind == 'newlines':
+            return ' '
+        # Markup can nest (e.g. a bold link), so strip inside the kept text too
+        return self._RE_MARKDOWN.sub(self._replace_markdown, match.group(kind))
+    
+    def iter_subreddit(self, subreddit_name, limit=50, time_filter='week', 
+                       min_time=60, max_time=120):
         """
-        Scrape motivational content from a specific subreddit
+        Yield motivational posts from a specific subreddit as they are fetched
         
         Args:
             subreddit_name: Name of subreddit to scrape
@@ -74,18 +202,18 @@ class RedditMotivationalScraper:
             min_time: Minimum reading time in seconds
             max_time: Maximum reading time in seconds (90 seconds default range)
             
-        Returns:
-            List of filtered posts
+        Yields:
+            Post dicts that pass the reading time filter
         """
-        print(f"Scraping r/{subreddit_name}...")
+        log.info(f"Scraping r/{subreddit_name}...")
         
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            posts = []
+            subreddit = self._get_reddit().subreddit(subreddit_name)
             
             # Get top posts from the specified time period
             for submission in subreddit.top(time_filter=time_filter, limit=limit):
-                # Skip stickied posts and deleted content
+                # Skip stickied posts and deleted content before reading
+                # any other field
                 if submission.stickied or not submission.selftext:
                     continue
                 
@@ -98,7 +226,8 @@ class RedditMotivationalScraper:
                 reading_time = self.estimate_reading_time(full_text)
                 
                 if min_time <= reading_time <= max_time:
-                    post_data = {
+                    log.info(f"✓ Found story: '{title[:50]}...' ({reading_time:.1f}s read)")
+                    yield {
                         'title': title,
                         'content': content,
                         'full_text': full_text,
@@ -110,21 +239,43 @@ class RedditMotivationalScraper:
                         'subreddit': subreddit_name,
                         'id': submission.id
                     }
-                    posts.append(post_data)
-                    print(f"✓ Found story: '{title[:50]}...' ({reading_time:.1f}s read)")
-                
-                # Rate limiting
-                time.sleep(0.1)
                 
         except Exception as e:
-            print(f"Error scraping r/{subreddit_name}: {e}")
+            log.error(f"Error scraping r/{subreddit_name}: {e}")
+    
+    def scrape_subreddit(self, subreddit_name, limit=50, time_filter='week', 
+                        min_time=60, max_time=120):
+        """
+        Scrape motivational content from a specific subreddit
+        
+        Args:
+            subreddit_name: Name of subreddit to scrape
+            limit: Maximum number of posts to fetch
+            time_filter: Time filter (hour, day, week, month, year, all)
+            min_time: Minimum reading time in seconds
+            max_time: Maximum reading time in seconds (90 seconds default range)
             
-        return posts
+        Returns:
+            List of filtered posts
+        """
+        return list(self.iter_subreddit(
+            subreddit_name, limit=limit, time_filter=time_filter,
+            min_time=min_time, max_time=max_time
+        ))
+    
+    def _scrape_pool(self, subreddits):
+        """Thread pool sized for fetching the given subreddits"""
+        # Requests are network-bound. Each thread has its own praw.Reddit,
+        # which fetches its own OAuth token and honours Reddit's rate-limit
+        # headers only for itself, while the quota is per client; so however
+        # many workers are configured, at most MAX_FETCH_THREADS run at once
+        workers = max(1, min(self.max_workers, self.MAX_FETCH_THREADS, len(subreddits)))
+        return ThreadPoolExecutor(max_workers=workers)
     
     def scrape_multiple_subreddits(self, subreddits, posts_per_sub=25, 
                                  min_time=60, max_time=120):
         """
-        Scrape from multiple subreddits
+        Scrape from multiple subreddits concurrently
         
         Args:
             subreddits: List of subreddit names
@@ -137,31 +288,50 @@ class RedditMotivationalScraper:
         """
         all_posts = []
         
-        for subreddit in subreddits:
-            posts = self.scrape_subreddit(
+        def scrape(subreddit):
+            return self.scrape_subreddit(
                 subreddit, 
                 limit=posts_per_sub, 
                 min_time=min_time, 
                 max_time=max_time
             )
-            all_posts.extend(posts)
-            print(f"Found {len(posts)} suitable posts in r/{subreddit}")
-            
-            # Rate limiting between subreddits
-            time.sleep(1)
+        
+        with self._scrape_pool(subreddits) as pool:
+            for subreddit, posts in zip(subreddits, pool.map(scrape, subreddits)):
+                all_posts.extend(posts)
+                log.info(f"Found {len(posts)} suitable posts in r/{subreddit}")
             
         return all_posts
     
+    def iter_multiple_subreddits(self, subreddits, posts_per_sub=25, 
+                                 min_time=60, max_time=120):
+        """
+        Like scrape_multiple_subreddits, but yield each subreddit's posts
+        as soon as it finishes instead of waiting for all of them
+        
+        Yields:
+            Post dicts, grouped by subreddit in completion order
+        """
+        with self._scrape_pool(subreddits) as pool:
+            futures = {
+                pool.submit(self.scrape_subreddit, subreddit, limit=posts_per_sub,
+                            min_time=min_time, max_time=max_time): subreddit
+                for subreddit in subreddits
+            }
+            for future in as_completed(futures):
+                posts = future.result()
+                log.info(f"Found {len(posts)} suitable posts in r/{futures[future]}")
+                yield from posts
+    
     def save_to_json(self, posts, filename):
         """Save posts to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(posts, f, indent=2, ensure_ascii=False)
-        print(f"Saved {len(posts)} posts to {filename}")
+        write_json(posts, filename)
+        log.info(f"Saved {len(posts)} posts to {filename}")
     
     def save_to_csv(self, posts, filename):
         """Save posts to CSV file"""
         if not posts:
-            print("No posts to save")
+            log.info("No posts to save")
             return
             
         fieldnames = posts[0].keys()
@@ -169,9 +339,70 @@ class RedditMotivationalScraper:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(posts)
-        print(f"Saved {len(posts)} posts to {filename}")
+        log.info(f"Saved {len(posts)} posts to {filename}")
+    
+    def save_to_both(self, posts, json_filename, csv_filename):
+        """Save posts to JSON and CSV files in a single pass over the list"""
+        with PostStreamWriter(json_filename, csv_filename, flush=False) as writer:
+            for post in posts:
+                writer.write(post)
+        log.info(f"Saved {len(posts)} posts to {json_filename} and {csv_filename}")
+
+class PostStreamWriter:
+    """
+    Write posts to JSON and CSV while scraping, so partial results are on
+    disk if the run is interrupted. The JSON output has the same layout as
+    save_to_json.
+    
+    Usage:
+        with PostStreamWriter('posts.json', 'posts.csv') as writer:
+            for post in scraper.iter_multiple_subreddits(subreddits):
+                writer.write(post)
+    """
+    
+    def __init__(self, json_path, csv_path, flush=True):
+        self.json_path = json_path
+        self.csv_path = csv_path
+        # Flush after every post so partial results survive a crash
+        self.flush = flush
+        self.count = 0
+    
+    def __enter__(self):
+        self._json_file = open(self.json_path, 'w', encoding='utf-8')
+        self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=POST_FIELDS)
+        self._csv_writer.writeheader()
+        self._json_file.write('[')
+        return self
+    
+    def write(self, post):
+        """Append one post to both files"""
+        separator = ',\n  ' if self.count else '\n  '
+        if orjson is not None:
+            item = orjson.dumps(post, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            item = json.dumps(post, indent=2, ensure_ascii=False)
+        self._json_file.write(separator + item.replace('\n', '\n  '))
+        self._csv_writer.writerow(post)
+        self.count += 1
+        
+        if self.flush:
+            self._json_file.flush()
+            self._csv_file.flush()
+    
+    def __exit__(self, exc_type, exc, tb):
+        # Close the array even on error so what was written stays valid JSON
+        self._json_file.write('\n]' if self.count else ']')
+        self._json_file.close()
+        self._csv_file.close()
+        return False
 
 def main():
+    import dotenv
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    # Load environment variables from .env file
+    dotenv.load_dotenv()
+    
     # Reddit API credentials (you need to get these from Reddit)
     CLIENT_ID = os.getenv('REDDIT_CLIENT_ID')
     CLIENT_SECRET = os.getenv('REDDIT_CLIENT_SECRET')
@@ -197,38 +428,46 @@ def main():
     print("Starting Reddit motivational content scraper...")
     print(f"Target reading time: 60-120 seconds (90 second range)")
     
-    # Scrape posts (looking for 60-120 second reads, which covers your 90 second target)
-    posts = scraper.scrape_multiple_subreddits(
-        subreddits=motivational_subreddits,
-        posts_per_sub=20,  # Fetch 20 posts per subreddit
-        min_time=60,       # 1 minute minimum
-        max_time=120       # 2 minute maximum (covers 90 seconds)
-    )
+    # Create timestamp for filenames
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    json_path = f"motivational_content_{timestamp}.json"
+    csv_path = f"motivational_content_{timestamp}.csv"
     
-    # Sort by score (popularity) and reading time
-    posts.sort(key=lambda x: (x['score'], -abs(x['reading_time_seconds'] - 90)), reverse=True)
+    # Scrape posts (looking for 60-120 second reads, which covers your 90 second target)
+    # and write them out as they arrive; only the fields needed for the
+    # summary are kept in memory
+    summaries = []
+    with PostStreamWriter(json_path, csv_path) as writer:
+        for post in scraper.iter_multiple_subreddits(
+            subreddits=motivational_subreddits,
+            posts_per_sub=20,  # Fetch 20 posts per subreddit
+            min_time=60,       # 1 minute minimum
+            max_time=120       # 2 minute maximum (covers 90 seconds)
+        ):
+            writer.write(post)
+            summaries.append({key: post[key] for key in ('title', 'score', 'reading_time_seconds')})
     
-    print(f"\nFound {len(posts)} motivational stories/quotes in the 60-120 second range")
+    print(f"\nFound {len(summaries)} motivational stories/quotes in the 60-120 second range")
     
-    if posts:
-        # Create timestamp for filenames
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if summaries:
+        print(f"Saved {len(summaries)} posts to {json_path}")
+        print(f"Saved {len(summaries)} posts to {csv_path}")
         
-        # Save results
-        scraper.save_to_json(posts, f"motivational_content_{timestamp}.json")
-        scraper.save_to_csv(posts, f"motivational_content_{timestamp}.csv")
+        reading_times = to_structured(summaries)['reading_time_seconds']
         
         # Display some statistics
-        avg_reading_time = sum(p['reading_time_seconds'] for p in posts) / len(posts)
-        print(f"Average reading time: {avg_reading_time:.1f} seconds")
-        print(f"Range: {min(p['reading_time_seconds'] for p in posts):.1f}s - {max(p['reading_time_seconds'] for p in posts):.1f}s")
+        print(f"Average reading time: {reading_times.mean():.1f} seconds")
+        print(f"Range: {reading_times.min():.1f}s - {reading_times.max():.1f}s")
         
-        # Show top 3 posts
+        # Show top 3 posts, by score (popularity) then closeness to 90 seconds
         print("\nTop 3 posts by score:")
-        for i, post in enumerate(posts[:3], 1):
-            print(f"{i}. '{post['title'][:60]}...' ({post['reading_time_seconds']}s, {post['score']} upvotes)")
+        for i, post in enumerate(rank_posts(summaries, keep=3), 1):
+            print(f"{i}. '{post['title'][:60]}...' "
+                  f"({post['reading_time_seconds']}s, {post['score']} upvotes)")
     
     else:
+        os.remove(json_path)
+        os.remove(csv_path)
         print("No suitable posts found. Try adjusting the time range or subreddits.")
 
 if __name__ == "__main__":
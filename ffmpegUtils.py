@@ -0,0 +1,167 @@
+"""
+FFmpeg helpers shared by the background and reel creators.
+Encoder detection runs once per process and the result is reused everywhere.
+"""
+
+import functools
+import os
+import shutil
+import subprocess
+import tempfile
+
+from moviepy.config import get_setting
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+# Same binary MoviePy uses, so probing and rendering agree on capabilities
+FFMPEG_BINARY = get_setting("FFMPEG_BINARY")
+
+# imageio-ffmpeg only bundles ffmpeg, so ffprobe is optional
+FFPROBE_BINARY = shutil.which("ffprobe")
+
+# Hardware H.264 encoders in order of preference (libx264 is the CPU fallback)
+HARDWARE_H264_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_amf', 'h264_videotoolbox')
+
+@functools.lru_cache(maxsize=None)
+def encoder_works(codec):
+    """Check that an encoder can actually open on this machine (not just compiled in)"""
+    cmd = [
+        FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+        '-frames:v', '1', '-c:v', codec, '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=15)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+@functools.lru_cache(maxsize=None)
+def detect_h264_encoder():
+    """
+    Pick the fastest working H.264 encoder for this host
+
+    Returns:
+        Encoder name usable with ffmpeg's -c:v / MoviePy's codec argument
+    """
+    try:
+        listed = subprocess.run(
+            [FFMPEG_BINARY, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=15
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return 'libx264'
+
+    for codec in HARDWARE_H264_ENCODERS:
+        if codec in listed and encoder_works(codec):
+            return codec
+
+    return 'libx264'
+
+def encoder_settings(codec, quality=23, fast=False):
+    """
+    Get preset and extra ffmpeg parameters for an H.264 encoder
+
+    Args:
+        codec: Encoder name (e.g. 'libx264', 'h264_nvenc')
+        quality: Constant-quality target, roughly equivalent to x264 CRF
+        fast: Favor encoding speed over file size on the CPU encoder
+
+    Returns:
+        (preset, ffmpeg_params) tuple for MoviePy's write_videofile
+    """
+    if codec == 'h264_nvenc':
+        return 'p4', ['-rc', 'vbr', '-cq', str(quality), '-b:v', '0',
+                      '-pix_fmt', 'yuv420p']
+    if codec == 'h264_qsv':
+        return 'medium', ['-global_quality', str(quality), '-pix_fmt', 'nv12']
+    if codec == 'h264_amf':
+        return 'balanced', ['-rc', 'cqp', '-qp_i', str(quality), '-qp_p', str(quality),
+                            '-pix_fmt', 'yuv420p']
+    if codec == 'h264_videotoolbox':
+        # videotoolbox ignores -preset, but MoviePy always passes one
+        return 'medium', ['-b:v', '8M', '-pix_fmt', 'yuv420p']
+    # veryfast encodes several times faster than medium at the same CRF,
+    # for a somewhat larger file
+    return 'veryfast' if fast else 'medium', ['-crf', str(quality), '-pix_fmt', 'yuv420p']
+
+def encoder_args(codec, quality=23, fast=False):
+    """Full '-c:v ...' argument list for a raw ffmpeg command"""
+    preset, ffmpeg_params = encoder_settings(codec, quality, fast)
+    return ['-c:v', codec, '-preset', preset] + ffmpeg_params
+
+def probe_video(path):
+    """
+    Read duration and display size of a video without decoding any frames
+
+    Returns:
+        (duration, width, height) with rotation already applied
+    """
+    infos = ffmpeg_parse_infos(path)
+    width, height = infos['video_size']
+    if infos.get('video_rotation', 0) in (90, 270):
+        width, height = height, width
+    return infos['duration'], width, height
+
+def keyframe_times(path):
+    """
+    List keyframe timestamps of the first video stream (demux only, no decoding)
+
+    Returns:
+        Sorted list of keyframe times in seconds, empty if ffprobe is unavailable
+    """
+    if not FFPROBE_BINARY:
+        return []
+
+    cmd = [
+        FFPROBE_BINARY, '-v', 'error', '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags', '-of', 'csv=print_section=0', path
+    ]
+    try:
+        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, text=True)
+    except (OSError, subprocess.SubprocessError):
+        return []
+
+    times = []
+    for line in output.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags and pts_time not in ('', 'N/A'):
+            times.append(float(pts_time))
+    return sorted(times)
+
+def run_ffmpeg(args, log_path=None):
+    """
+    Run ffmpeg with the given arguments
+
+    stderr goes to a file rather than a pipe, so a long encode can never
+    stall on a full pipe buffer or pile its log up in memory.
+
+    Args:
+        args: ffmpeg arguments (without the binary)
+        log_path: Keep ffmpeg's log at this path (default: temporary file)
+
+    Raises:
+        RuntimeError: If ffmpeg exits with a non-zero status
+    """
+    cmd = [FFMPEG_BINARY, '-y', '-hide_banner', '-loglevel', 'error'] + list(args)
+    with (open(log_path, 'w+b') if log_path else tempfile.TemporaryFile()) as log:
+        process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.DEVNULL, stderr=log)
+        try:
+            # Short waits keep Ctrl+C responsive on every platform
+            while True:
+                try:
+                    returncode = process.wait(timeout=0.5)
+                    break
+                except subprocess.TimeoutExpired:
+                    continue
+        except KeyboardInterrupt:
+            process.terminate()
+            process.wait()
+            raise
+
+        if returncode != 0:
+            log.seek(0, os.SEEK_END)
+            log.seek(max(0, log.tell() - 500))
+            error = log.read().decode('utf-8', errors='replace').strip()
+            raise RuntimeError(f"ffmpeg failed: {error}")
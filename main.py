@@ -8,192 +8,333 @@ import os
 import sys
 import time
 import argparse
+import logging
 import json
+import copy
+from dataclasses import asdict
+import shutil
+import hashlib
+import importlib
 from datetime import datetime
 from pathlib import Path
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
-# Import our custom modules
-try:
-    from background import InstagramBGCreator
-    from contentScraper import RedditMotivationalScraper
-    from reelCreator import InstagramReelCreator
-except ImportError as e:
-    print(f"❌ Error importing modules: {e}")
-    print("Make sure background.py, contentScraper.py, and reelCreator.py are in the same directory")
-    sys.exit(1)
+import dotenv
+
+from pipelineConfig import BackgroundConfig, PipelineConfig
+
+log = logging.getLogger(__name__)
+
+def import_component(module_name: str, name: str):
+    """
+    Import one of our custom modules on first use. They pull in MoviePy, PRAW
+    and Kokoro, so utility commands like --create-config stay fast.
+    """
+    try:
+        return getattr(importlib.import_module(module_name), name)
+    except ImportError as e:
+        log.error(f"❌ Error importing modules: {e}")
+        log.error("Make sure background.py, contentScraper.py, and reelCreator.py are in the same directory")
+        sys.exit(1)
+
+def link_or_copy(src, dst):
+    """Hard-link src to dst (no data copied), falling back to a copy across filesystems"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
 
 class InstagramReelPipeline:
     """Main pipeline controller for Instagram Reel creation"""
     
-    def __init__(self, config: Dict):
-        """Initialize the pipeline with configuration"""
+    def __init__(self, config: PipelineConfig, session_id: Optional[str] = None):
+        """
+        Initialize the pipeline with configuration
+        
+        Args:
+            config: Pipeline configuration (a JSON-style dict is parsed first)
+            session_id: Existing session to resume (default: start a new one)
+        """
+        if isinstance(config, dict):
+            config = PipelineConfig.from_dict(config)
         self.config = config
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.output_base = Path(config.get('output_folder', 'instagram_pipeline_output'))
+        self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_base = Path(config.output_folder)
         
         # Create session folder
         self.session_folder = self.output_base / f"session_{self.session_id}"
         self.session_folder.mkdir(parents=True, exist_ok=True)
         
+        # Results so far, rewritten to the summary file after every step and reel
+        self.summary_file = self.session_folder / 'session_summary.json'
+        self.results = None
+        self._summary_lock = threading.Lock()
+        
+        # Probe the fastest H.264 encoder once and use it for every step, so
+        # backgrounds and reels are encoded consistently
+        self.encoder = import_component('ffmpegUtils', 'detect_h264_encoder')()
+        
         # Initialize components
         self.bg_creator = None
         self.content_scraper = None
         self.reel_creator = None
         
-        print(f"🚀 Instagram Reel Pipeline Initialized")
-        print(f"📁 Session folder: {self.session_folder}")
+        log.info(f"🚀 Instagram Reel Pipeline Initialized")
+        log.info(f"📁 Session folder: {self.session_folder}")
+        log.info(f"🎞️  Video encoder: {self.encoder}")
         
     def step_1_create_background_video(self) -> Optional[Path]:
         """Step 1: Create background video"""
-        print("\n" + "="*60)
-        print("STEP 1: CREATING BACKGROUND VIDEO")
-        print("="*60)
+        log.info("\n" + "="*60)
+        log.info("STEP 1: CREATING BACKGROUND VIDEO")
+        log.info("="*60)
         
         try:
             # Initialize background creator
-            stock_folder = self.config.get('stock_videos_folder', 'StockVideos')
+            stock_folder = self.config.stock_videos_folder
             bg_output_folder = self.session_folder / 'backgrounds'
             
+            # Background video configuration
+            bg_config = self.config.background
+            
+            # Reuse a previous render when stock footage and settings are unchanged
+            cache_path = None
+            if bg_config.use_cache:
+                cache_path = self.background_cache_path(stock_folder, bg_config)
+                if cache_path.exists():
+                    bg_output_folder.mkdir(parents=True, exist_ok=True)
+                    background_path = bg_output_folder / f"background_{self.session_id}.mp4"
+                    link_or_copy(cache_path, background_path)
+                    log.info(f"♻️  Reusing cached background video: {cache_path.name}")
+                    return background_path
+            
+            # Segment cache lives outside the session folder so it survives across runs
+            InstagramBGCreator = import_component('background', 'InstagramBGCreator')
             self.bg_creator = InstagramBGCreator(
                 stock_folder=stock_folder,
-                output_folder=str(bg_output_folder)
+                output_folder=str(bg_output_folder),
+                encoder=self.encoder,
+                use_cache=bg_config.use_cache,
+                cache_folder=str(self.output_base / 'segment_cache'),
+                hwaccel=bg_config.hwaccel
             )
             
-            # Background video configuration
-            bg_config = self.config.get('background', {})
-            
             background_path = self.bg_creator.create_background_video(
-                duration=bg_config.get('duration', 120),  # 2 minutes default
-                num_clips=bg_config.get('num_clips', None),
-                effect_type=bg_config.get('effect_type', 'cinematic'),
-                transition_duration=bg_config.get('transition_duration', 1.5),
-                transition_type=bg_config.get('transition_type', 'crossfade'),
+                duration=bg_config.duration,
+                num_clips=bg_config.num_clips,
+                effect_type=bg_config.effect_type,
+                transition_duration=bg_config.transition_duration,
+                transition_type=bg_config.transition_type,
                 output_name=f"background_{self.session_id}.mp4"
             )
             
-            print(f"✅ Background video created: {background_path}")
+            if cache_path:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                partial_path = cache_path.with_suffix('.partial.mp4')
+                link_or_copy(background_path, partial_path)
+                os.replace(partial_path, cache_path)
+            
+            log.info(f"✅ Background video created: {background_path}")
             return Path(background_path)
             
         except Exception as e:
-            print(f"❌ Background video creation failed: {e}")
+            log.error(f"❌ Background video creation failed: {e}")
             return None
     
+    def background_cache_path(self, stock_folder, bg_config: BackgroundConfig) -> Path:
+        """Cache file for a background render of this stock footage and config"""
+        fingerprint = hashlib.blake2b(digest_size=16)
+        for entry in sorted(os.scandir(stock_folder), key=lambda e: e.name):
+            if entry.is_file():
+                stat = entry.stat()
+                fingerprint.update(f"{entry.name}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+        # Settings that only change how the video is rendered, not what it looks like
+        render_only = ('use_cache', 'hwaccel')
+        settings = {k: v for k, v in asdict(bg_config).items() if k not in render_only}
+        fingerprint.update(json.dumps(settings, sort_keys=True).encode())
+        return self.output_base / 'bg_cache' / f"{fingerprint.hexdigest()}.mp4"
+    
     def step_2_scrape_content(self) -> Optional[Path]:
         """Step 2: Scrape motivational content from Reddit"""
-        print("\n" + "="*60)
-        print("STEP 2: SCRAPING CONTENT FROM REDDIT")
-        print("="*60)
+        log.info("\n" + "="*60)
+        log.info("STEP 2: SCRAPING CONTENT FROM REDDIT")
+        log.info("="*60)
         
         try:
             # Check for Reddit credentials
             client_id = os.getenv('REDDIT_CLIENT_ID')
             client_secret = os.getenv('REDDIT_CLIENT_SECRET')
-            user_agent = self.config.get('reddit', {}).get('user_agent', 
-                                        "InstagramReelPipeline/1.0 by ReelCreator")
+            user_agent = self.config.reddit.user_agent
             
             if not client_id or not client_secret:
-                print("⚠️ Reddit API credentials not found in environment variables")
-                print("Please set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET")
+                log.warning("⚠️ Reddit API credentials not found in environment variables")
+                log.info("Please set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET")
                 
                 # Try to use existing content file if specified
-                existing_content = self.config.get('existing_content_file')
+                existing_content = self.config.existing_content_file
                 if existing_content and Path(existing_content).exists():
-                    print(f"📄 Using existing content file: {existing_content}")
+                    log.info(f"📄 Using existing content file: {existing_content}")
                     return Path(existing_content)
                 else:
-                    print("❌ No existing content file found")
+                    log.error("❌ No existing content file found")
                     return None
             
+            # Content scraping configuration
+            content_config = self.config.content
+            
             # Initialize content scraper
+            RedditMotivationalScraper = import_component('contentScraper',
+                                                         'RedditMotivationalScraper')
             self.content_scraper = RedditMotivationalScraper(
                 client_id=client_id,
                 client_secret=client_secret,
-                user_agent=user_agent
+                user_agent=user_agent,
+                max_workers=content_config.workers
             )
             
-            # Content scraping configuration
-            content_config = self.config.get('content', {})
-            
-            # Define subreddits to scrape
-            subreddits = content_config.get('subreddits', [
-                'GetMotivated', 'motivation', 'wholesomememes', 'LifeProTips',
-                'decidingtobebetter', 'selfimprovement', 'quotes', 'productivity'
-            ])
-            
             # Scrape content
             posts = self.content_scraper.scrape_multiple_subreddits(
-                subreddits=subreddits,
-                posts_per_sub=content_config.get('posts_per_sub', 25),
-                min_time=content_config.get('min_reading_time', 30),
-                max_time=content_config.get('max_reading_time', 180)
+                subreddits=content_config.subreddits,
+                posts_per_sub=content_config.posts_per_sub,
+                min_time=content_config.min_reading_time,
+                max_time=content_config.max_reading_time
             )
             
             if not posts:
-                print("❌ No suitable content found")
+                log.error("❌ No suitable content found")
                 return None
             
-            # Sort posts by score and reading time
-            posts.sort(key=lambda x: (x['score'], -abs(x['reading_time_seconds'] - 90)), 
-                      reverse=True)
+            # Rank posts by score and reading time on a columnar copy, keeping
+            # the best ones with 3x headroom for retries; only a few become reels
+            rank_posts = import_component('contentScraper', 'rank_posts')
+            found = len(posts)
+            posts = rank_posts(posts, keep=self.config.reels.num_reels * 3)
             
-            # Save content
+            # Save content, plus a CSV for easy viewing, in one pass
             content_file = self.session_folder / f"content_{self.session_id}.json"
-            self.content_scraper.save_to_json(posts, str(content_file))
-            
-            # Also save CSV for easy viewing
             csv_file = self.session_folder / f"content_{self.session_id}.csv"
-            self.content_scraper.save_to_csv(posts, str(csv_file))
+            self.content_scraper.save_to_both(posts, str(content_file), str(csv_file))
             
-            print(f"✅ Content scraped and saved: {content_file}")
-            print(f"📊 Found {len(posts)} suitable posts")
+            log.info(f"✅ Content scraped and saved: {content_file}")
+            log.info(f"📊 Found {found} suitable posts, kept the top {len(posts)}")
             
             return content_file
             
         except Exception as e:
-            print(f"❌ Content scraping failed: {e}")
+            log.error(f"❌ Content scraping failed: {e}")
             return None
     
-    def step_3_create_reels(self, background_video: Path, content_file: Path) -> List[Path]:
-        """Step 3: Create Instagram Reels"""
-        print("\n" + "="*60)
-        print("STEP 3: CREATING INSTAGRAM REELS")
-        print("="*60)
+    def get_reel_creator(self):
+        """Reel creator shared by the voice-over prefetch and step 3"""
+        if self.reel_creator is None:
+            # Voice-over cache lives outside the session folder so reruns reuse it
+            tts_cache_folder = None
+            if self.config.reels.tts_cache:
+                tts_cache_folder = str(self.output_base / 'tts_cache')
+            InstagramReelCreator = import_component('reelCreator', 'InstagramReelCreator')
+            self.reel_creator = InstagramReelCreator(
+                output_folder=str(self.session_folder / 'reels'),
+                tts_cache_folder=tts_cache_folder,
+                hwaccel=self.config.background.hwaccel,
+                encoder=self.encoder
+            )
+        return self.reel_creator
+    
+    def prepare_voiceovers(self, content_file: Path, num_reels: int,
+                           skip_titles: Optional[List[str]] = None) -> Optional[List[Dict]]:
+        """
+        Pick the content for step 3 and synthesize its voice-overs into the
+        TTS cache. TTS only needs the text, so this runs while step 1 encodes.
+        
+        Returns:
+            The selected content items, or None on failure
+        """
+        try:
+            reel_config = self.config.reels
+            reel_creator = self.get_reel_creator()
+            selected = reel_creator.select_content(str(content_file), num_reels, skip_titles)
+            log.info(f"🎤 Synthesizing {len(selected)} voice-overs while the background renders")
+            for content_item in selected:
+                reel_creator.synthesize_only(content_item, reel_config.language,
+                                             reel_config.voice, reel_config.voice_speed)
+            return selected
+        except Exception as e:
+            log.warning(f"⚠️ Voice-over prefetch failed: {e}")
+            return None
+    
+    def step_3_create_reels(self, background_video: Path, content_file: Path,
+                            num_reels: Optional[int] = None,
+                            skip_titles: Optional[List[str]] = None,
+                            selected_content: Optional[List[Dict]] = None) -> List[Path]:
+        """
+        Step 3: Create Instagram Reels
+        
+        Args:
+            num_reels: Reels to create (default: reels.num_reels from the config)
+            skip_titles: Titles of content already made into reels
+            selected_content: Content picked (and voiced) by prepare_voiceovers
+        """
+        log.info("\n" + "="*60)
+        log.info("STEP 3: CREATING INSTAGRAM REELS")
+        log.info("="*60)
         
         created_reels = []
         
         try:
-            # Initialize reel creator
-            reel_output_folder = self.session_folder / 'reels'
-            self.reel_creator = InstagramReelCreator(output_folder=str(reel_output_folder))
-            
             # Reel creation configuration
-            reel_config = self.config.get('reels', {})
+            reel_config = self.config.reels
+            reel_creator = self.get_reel_creator()
+            
+            # Parallel reel workers; consumer NVIDIA GPUs only allow a few
+            # concurrent NVENC sessions, so keep it low when using CUDA
+            workers = reel_config.workers or max(1, (os.cpu_count() or 2) // 2)
+            if self.encoder == 'h264_nvenc' or self.config.background.hwaccel == 'cuda':
+                workers = min(workers, 2)
+            
+            def record_reel(reel):
+                # Persist every finished reel, so a crash later in the batch keeps it
+                if self.results is not None:
+                    self.results['created_reels'].append(str(reel['file']))
+                    self.results['reel_titles'].append(reel['title'])
+                    self._write_summary()
             
             # Create reels
-            reels = self.reel_creator.create_batch_reels(
+            reels = reel_creator.create_batch_reels(
                 background_video=str(background_video),
                 content_file=str(content_file),
-                num_reels=reel_config.get('num_reels', 5),
-                lang=reel_config.get('language', 'a'),
-                voice=reel_config.get('voice', 'af_heart'),
-                style=reel_config.get('text_style', 'modern'),
-                animation=reel_config.get('text_animation', 'fade'),
-                voice_speed=reel_config.get('voice_speed', 1.0),
-                max_duration=reel_config.get('max_duration', 90)
+                num_reels=num_reels or reel_config.num_reels,
+                workers=workers,
+                on_reel=record_reel,
+                skip_titles=skip_titles,
+                selected_content=selected_content,
+                lang=reel_config.language,
+                voice=reel_config.voice,
+                style=reel_config.text_style,
+                animation=reel_config.text_animation,
+                voice_speed=reel_config.voice_speed,
+                max_duration=reel_config.max_duration
             )
             
             for reel in reels:
                 created_reels.append(reel['file'])
-                print(f"✅ Created: {reel['file'].name}")
+                log.info(f"✅ Created: {reel['file'].name}")
             
             return created_reels
             
         except Exception as e:
-            print(f"❌ Reel creation failed: {e}")
+            log.error(f"❌ Reel creation failed: {e}")
             return []
     
+    def load_previous_results(self) -> Dict:
+        """Results recorded by an earlier, possibly interrupted, run of this session"""
+        if not self.summary_file.exists():
+            return {}
+        with open(self.summary_file, 'r', encoding='utf-8') as f:
+            return json.load(f).get('results', {})
+    
     def run_pipeline(self) -> Dict:
         """Run the complete pipeline"""
         start_time = time.time()
@@ -204,156 +345,216 @@ class InstagramReelPipeline:
             'background_video': None,
             'content_file': None,
             'created_reels': [],
+            'reel_titles': [],
             'errors': [],
             'processing_time': 0
         }
+        self.results = results
         
-        print("🎬 Starting Instagram Reel Creation Pipeline")
-        print(f"Session ID: {self.session_id}")
+        log.info("🎬 Starting Instagram Reel Creation Pipeline")
+        log.info(f"Session ID: {self.session_id}")
         
         try:
-            # Step 1: Create background video
-            if self.config.get('skip_background', False):
+            # Outputs recorded by an earlier run of this session are reused as-is
+            background_path = content_path = None
+            previous = self.load_previous_results()
+            if previous:
+                log.info("🔁 Resuming session from its last saved summary")
+                if previous.get('background_video') and Path(previous['background_video']).exists():
+                    background_path = Path(previous['background_video'])
+                    log.info(f"📹 Reusing background: {background_path}")
+                if previous.get('content_file') and Path(previous['content_file']).exists():
+                    content_path = Path(previous['content_file'])
+                    log.info(f"📄 Reusing content: {content_path}")
+                for reel, title in zip(previous.get('created_reels', []),
+                                       previous.get('reel_titles', [])):
+                    if Path(reel).exists():
+                        results['created_reels'].append(reel)
+                        results['reel_titles'].append(title)
+            
+            # Resolve existing inputs first so a bad path fails before any work starts
+            if background_path is None and self.config.skip_background:
                 # Use existing background video
-                background_path = Path(self.config.get('existing_background_video'))
+                background_path = Path(self.config.existing_background_video)
                 if not background_path.exists():
                     raise FileNotFoundError(f"Background video not found: {background_path}")
-                print(f"📹 Using existing background: {background_path}")
-            else:
-                background_path = self.step_1_create_background_video()
-                if not background_path:
-                    results['errors'].append("Background video creation failed")
-                    return results
+                log.info(f"📹 Using existing background: {background_path}")
             
-            results['background_video'] = str(background_path)
-            
-            # Step 2: Scrape content
-            if self.config.get('skip_scraping', False):
+            if content_path is None and self.config.skip_scraping:
                 # Use existing content file
-                content_path = Path(self.config.get('existing_content_file'))
+                content_path = Path(self.config.existing_content_file)
                 if not content_path.exists():
                     raise FileNotFoundError(f"Content file not found: {content_path}")
-                print(f"📄 Using existing content: {content_path}")
-            else:
-                content_path = self.step_2_scrape_content()
-                if not content_path:
-                    results['errors'].append("Content scraping failed")
-                    return results
-            
-            results['content_file'] = str(content_path)
-            
-            # Step 3: Create reels
-            created_reels = self.step_3_create_reels(background_path, content_path)
-            if not created_reels:
+                log.info(f"📄 Using existing content: {content_path}")
+            
+            if background_path:
+                results['background_video'] = str(background_path)
+            if content_path:
+                results['content_file'] = str(content_path)
+            
+            remaining = self.config.reels.num_reels - len(results['created_reels'])
+            
+            # Step 1 is bound by ffmpeg and step 2 by Reddit's API, so run them
+            # side by side and wait for both before creating reels
+            # Once the content is in, voice it while the background is still
+            # encoding; step 3 then finds every voice-over in the TTS cache
+            prefetch = (remaining > 0 and self.config.reels.tts_cache
+                        and background_path is None)
+            voiceovers = None
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                futures = {}
+                if background_path is None:
+                    background_future = pool.submit(self.step_1_create_background_video)
+                    futures[background_future] = 'background_video'
+                if content_path is None:
+                    futures[pool.submit(self.step_2_scrape_content)] = 'content_file'
+                
+                def start_voiceovers():
+                    return pool.submit(self.prepare_voiceovers, Path(results['content_file']),
+                                       remaining, results['reel_titles'])
+                
+                if prefetch and content_path:
+                    voiceovers = start_voiceovers()
+                
+                # Record each step as soon as it finishes so a later crash keeps it
+                for future in as_completed(futures):
+                    path = future.result()
+                    if path:
+                        results[futures[future]] = str(path)
+                        self._write_summary()
+                    if (prefetch and voiceovers is None and results['content_file']
+                            and not background_future.done()):
+                        voiceovers = start_voiceovers()
+            
+            if not results['background_video']:
+                results['errors'].append("Background video creation failed")
+            if not results['content_file']:
+                results['errors'].append("Content scraping failed")
+            if results['errors']:
+                return results
+            
+            # Step 3: Create the reels still missing from this session
+            if remaining > 0:
+                self.step_3_create_reels(Path(results['background_video']),
+                                         Path(results['content_file']),
+                                         num_reels=remaining,
+                                         skip_titles=results['reel_titles'],
+                                         selected_content=voiceovers and voiceovers.result())
+            if not results['created_reels']:
                 results['errors'].append("Reel creation failed")
                 return results
             
-            results['created_reels'] = [str(reel) for reel in created_reels]
             results['success'] = True
             
-            # Save session summary
-            self.save_session_summary(results)
-            
         except Exception as e:
             results['errors'].append(str(e))
-            print(f"❌ Pipeline error: {e}")
+            log.error(f"❌ Pipeline error: {e}")
         
         finally:
             results['processing_time'] = time.time() - start_time
             
+            # Save session summary (also on failure, so --resume can pick it up)
+            self.save_session_summary(results)
+            
             # Cleanup
             if self.reel_creator:
                 self.reel_creator.cleanup()
         
         return results
     
-    def save_session_summary(self, results: Dict):
-        """Save session summary to JSON file"""
-        summary_file = self.session_folder / 'session_summary.json'
-        
+    def _write_summary(self):
+        """Write the results so far to session_summary.json"""
         summary = {
             'session_id': self.session_id,
             'timestamp': datetime.now().isoformat(),
-            'config': self.config,
-            'results': results
+            'config': self.config.to_dict(),
+            'results': self.results
         }
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
-        
-        print(f"📄 Session summary saved: {summary_file}")
+        write_json = import_component('contentScraper', 'write_json')
+        # Steps finish on different threads; write atomically so a crash
+        # mid-write never leaves a truncated summary behind
+        with self._summary_lock:
+            partial_file = self.summary_file.with_suffix('.json.partial')
+            write_json(summary, partial_file)
+            os.replace(partial_file, self.summary_file)
+    
+    def save_session_summary(self, results: Dict):
+        """Save session summary to JSON file"""
+        self.results = results
+        self._write_summary()
+        log.info(f"📄 Session summary saved: {self.summary_file}")
     
     def print_final_summary(self, results: Dict):
         """Print final pipeline summary"""
-        print("\n" + "="*60)
-        print("🎉 PIPELINE SUMMARY")
-        print("="*60)
+        log.info("\n" + "="*60)
+        log.info("🎉 PIPELINE SUMMARY")
+        log.info("="*60)
         
         if results['success']:
-            print(f"✅ Pipeline completed successfully!")
-            print(f"⏱️  Total processing time: {results['processing_time']:.1f}s")
-            print(f"📁 Session folder: {results['session_folder']}")
-            print(f"📹 Background video: {Path(results['background_video']).name}")
-            print(f"📄 Content file: {Path(results['content_file']).name}")
-            print(f"🎬 Created reels: {len(results['created_reels'])}")
+            log.info(f"✅ Pipeline completed successfully!")
+            log.info(f"⏱️  Total processing time: {results['processing_time']:.1f}s")
+            log.info(f"📁 Session folder: {results['session_folder']}")
+            log.info(f"📹 Background video: {Path(results['background_video']).name}")
+            log.info(f"📄 Content file: {Path(results['content_file']).name}")
+            log.info(f"🎬 Created reels: {len(results['created_reels'])}")
             
             if results['created_reels']:
-                print("\nCreated Reel Files:")
+                log.info("\nCreated Reel Files:")
                 for reel_path in results['created_reels']:
-                    print(f"  📱 {Path(reel_path).name}")
+                    log.info(f"  📱 {Path(reel_path).name}")
             
-            print(f"\n📋 Full results saved in: {results['session_folder']}")
+            log.info(f"\n📋 Full results saved in: {results['session_folder']}")
         else:
-            print("❌ Pipeline failed!")
-            print(f"⏱️  Processing time: {results['processing_time']:.1f}s")
+            log.error("❌ Pipeline failed!")
+            log.info(f"⏱️  Processing time: {results['processing_time']:.1f}s")
             
             if results['errors']:
-                print("\nErrors encountered:")
+                log.info("\nErrors encountered:")
                 for error in results['errors']:
-                    print(f"  ❌ {error}")
+                    log.error(f"  ❌ {error}")
+
+# Defaults for every pipeline setting; create_default_config hands out copies
+_DEFAULT_CONFIG = PipelineConfig().to_dict()
 
 def create_default_config() -> Dict:
     """Create default configuration"""
-    return {
-        'output_folder': 'instagram_pipeline_output',
-        'stock_videos_folder': 'StockVideos',
-        'skip_background': False,
-        'skip_scraping': False,
-        'existing_background_video': None,
-        'existing_content_file': None,
-        
-        'background': {
-            'duration': 120,
-            'num_clips': None,
-            'effect_type': 'cinematic',
-            'transition_duration': 1.5,
-            'transition_type': 'crossfade'
-        },
-        
-        'content': {
-            'subreddits': [
-                'GetMotivated', 'motivation', 'wholesomememes', 'LifeProTips',
-                'decidingtobebetter', 'selfimprovement', 'quotes', 'productivity',
-                'findapath', 'UpliftingNews'
-            ],
-            'posts_per_sub': 25,
-            'min_reading_time': 30,
-            'max_reading_time': 180
-        },
-        
-        'reddit': {
-            'user_agent': 'InstagramReelPipeline/1.0 by ReelCreator'
-        },
-        
-        'reels': {
-            'num_reels': 5,
-            'language': 'a',
-            'voice': 'af_heart',
-            'text_style': 'modern',
-            'text_animation': 'fade',
-            'voice_speed': 1.0,
-            'max_duration': 90
-        }
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+def apply_cli_overrides(config: Dict, args: argparse.Namespace):
+    """Override config values with command line arguments"""
+    config['output_folder'] = args.output_folder
+    config['stock_videos_folder'] = args.stock_folder
+    config['skip_background'] = args.skip_background
+    config['skip_scraping'] = args.skip_scraping
+    config['existing_background_video'] = args.existing_bg
+    config['existing_content_file'] = args.existing_content
+    
+    # Background options
+    config['background'] = config.get('background', {}) | {
+        'duration': args.bg_duration,
+        'effect_type': args.effect_type,
+        'transition_type': args.transition_type,
+        'use_cache': not args.no_cache,
+        'hwaccel': args.hwaccel
+    }
+    
+    # Content options
+    config['content'] = config.get('content', {}) | {
+        'posts_per_sub': args.posts_per_sub,
+        'min_reading_time': args.min_time,
+        'max_reading_time': args.max_time
+    }
+    
+    # Reel options
+    config['reels'] = config.get('reels', {}) | {
+        'num_reels': args.num_reels,
+        'voice': args.voice,
+        'voice_speed': args.voice_speed,
+        'text_style': args.text_style,
+        'text_animation': args.text_animation,
+        'max_duration': args.max_duration,
+        'workers': args.reel_workers
     }
 
 def main():
@@ -414,8 +615,12 @@ Available Voices:
                          help='Background video duration in seconds')
     bg_group.add_argument('--effect-type', choices=['subtle', 'cinematic', 'warm', 'cool'],
                          default='cinematic', help='Background effect type')
-    bg_group.add_argument('--transition-type', choices=['crossfade', 'slide', 'zoom'],
+    bg_group.add_argument('--transition-type', choices=['crossfade', 'slide', 'zoom', 'hardcut'],
                          default='crossfade', help='Background transition type')
+    bg_group.add_argument('--no-cache', action='store_true',
+                         help='Re-render background segments instead of reusing cached ones')
+    bg_group.add_argument('--hwaccel', choices=['auto', 'cuda', 'qsv', 'videotoolbox'],
+                         default=None, help='Hardware decoder for stock footage')
     
     # Content scraping options
     content_group = parser.add_argument_group('Content Scraping Options')
@@ -444,104 +649,105 @@ Available Voices:
                            default='fade', help='Text animation type')
     reel_group.add_argument('--max-duration', type=int, default=90,
                            help='Maximum reel duration in seconds')
+    reel_group.add_argument('--reel-workers', type=int, default=None,
+                           help='Reels rendered in parallel (default: half the CPU cores)')
     
     # Utility options
     parser.add_argument('--create-config', type=str,
                        help='Create a default configuration file and exit')
     parser.add_argument('--list-voices', action='store_true',
                        help='List available TTS voices and exit')
+    parser.add_argument('--resume', type=str, metavar='SESSION_ID',
+                       help='Resume an interrupted session, skipping steps it completed')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show configuration and exit without processing')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Only show warnings and errors')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    
+    # Load REDDIT_CLIENT_ID / REDDIT_CLIENT_SECRET from a .env file if present
+    dotenv.load_dotenv()
+    
     try:
         # Handle utility options
         if args.list_voices:
-            creator = InstagramReelCreator()
-            creator.list_voices()
+            # A constant list; building a creator would make folders and probe encoders
+            import_component('reelCreator', 'InstagramReelCreator').list_voices()
             return 0
         
         if args.create_config:
-            config = create_default_config()
+            # Only serialized, so the template itself can be written out
             config_path = Path(args.create_config)
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            print(f"✅ Default configuration created: {config_path}")
+            write_json = import_component('contentScraper', 'write_json')
+            write_json(_DEFAULT_CONFIG, config_path)
+            log.info(f"✅ Default configuration created: {config_path}")
             return 0
         
         # Load or create configuration
-        if args.config:
+        if args.resume:
+            # A resumed session keeps the configuration it was started with
+            summary_file = (Path(args.output_folder) / f"session_{args.resume}" /
+                            'session_summary.json')
+            if not summary_file.exists():
+                log.error(f"❌ Session summary not found: {summary_file}")
+                return 1
+            
+            with open(summary_file, 'r', encoding='utf-8') as f:
+                config = json.load(f)['config']
+            log.info(f"🔁 Resuming session: {args.resume}")
+        elif args.config:
             config_path = Path(args.config)
             if not config_path.exists():
-                print(f"❌ Configuration file not found: {config_path}")
+                log.error(f"❌ Configuration file not found: {config_path}")
                 return 1
             
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-            print(f"📄 Loaded configuration from: {config_path}")
+            log.info(f"📄 Loaded configuration from: {config_path}")
         else:
             config = create_default_config()
         
-        # Override config with command line arguments
-        config['output_folder'] = args.output_folder
-        config['stock_videos_folder'] = args.stock_folder
-        config['skip_background'] = args.skip_background
-        config['skip_scraping'] = args.skip_scraping
-        config['existing_background_video'] = args.existing_bg
-        config['existing_content_file'] = args.existing_content
+        if not args.resume:
+            apply_cli_overrides(config, args)
         
-        # Background options
-        config['background'].update({
-            'duration': args.bg_duration,
-            'effect_type': args.effect_type,
-            'transition_type': args.transition_type
-        })
-        
-        # Content options
-        config['content'].update({
-            'posts_per_sub': args.posts_per_sub,
-            'min_reading_time': args.min_time,
-            'max_reading_time': args.max_time
-        })
-        
-        # Reel options
-        config['reels'].update({
-            'num_reels': args.num_reels,
-            'voice': args.voice,
-            'voice_speed': args.voice_speed,
-            'text_style': args.text_style,
-            'text_animation': args.text_animation,
-            'max_duration': args.max_duration
-        })
+        # Parse once so unknown or misspelled settings fail before any work starts
+        try:
+            config = PipelineConfig.from_dict(config)
+        except (TypeError, ValueError) as e:
+            log.error(f"❌ Invalid configuration: {e}")
+            return 1
         
         # Validation
-        if config['skip_background'] and not config.get('existing_background_video'):
-            print("❌ Error: --existing-bg required when using --skip-background")
+        if config.skip_background and not config.existing_background_video:
+            log.error("❌ Error: --existing-bg required when using --skip-background")
             return 1
         
-        if config['skip_scraping'] and not config.get('existing_content_file'):
-            print("❌ Error: --existing-content required when using --skip-scraping")
+        if config.skip_scraping and not config.existing_content_file:
+            log.error("❌ Error: --existing-content required when using --skip-scraping")
             return 1
         
         # Show configuration
-        print("🔧 PIPELINE CONFIGURATION")
-        print("="*50)
-        print(f"Output Folder: {config['output_folder']}")
-        print(f"Stock Videos: {config['stock_videos_folder']}")
-        print(f"Skip Background: {config['skip_background']}")
-        print(f"Skip Scraping: {config['skip_scraping']}")
-        print(f"Number of Reels: {config['reels']['num_reels']}")
-        print(f"TTS Voice: {config['reels']['voice']}")
-        print(f"Text Style: {config['reels']['text_style']}")
-        print("="*50)
+        log.info("🔧 PIPELINE CONFIGURATION")
+        log.info("="*50)
+        log.info(f"Output Folder: {config.output_folder}")
+        log.info(f"Stock Videos: {config.stock_videos_folder}")
+        log.info(f"Skip Background: {config.skip_background}")
+        log.info(f"Skip Scraping: {config.skip_scraping}")
+        log.info(f"Number of Reels: {config.reels.num_reels}")
+        log.info(f"TTS Voice: {config.reels.voice}")
+        log.info(f"Text Style: {config.reels.text_style}")
+        log.info("="*50)
         
         if args.dry_run:
-            print("🔍 Dry run completed. Configuration looks good!")
+            log.info("🔍 Dry run completed. Configuration looks good!")
             return 0
         
         # Initialize and run pipeline
-        pipeline = InstagramReelPipeline(config)
+        pipeline = InstagramReelPipeline(config, session_id=args.resume)
         results = pipeline.run_pipeline()
         
         # Print final summary
@@ -550,10 +756,10 @@ Available Voices:
         return 0 if results['success'] else 1
         
     except KeyboardInterrupt:
-        print("\n⚠️  Pipeline interrupted by user")
+        log.warning("\n⚠️  Pipeline interrupted by user")
         return 1
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error(f"❌ Unexpected error: {e}")
         import traceback
         traceback.print_exc()
         return 1
@@ -0,0 +1,103 @@
+"""
+Typed configuration for the Instagram Reel pipeline.
+The JSON config is parsed into these dataclasses once, so unknown keys fail
+before any work starts and steps read settings as plain attributes.
+"""
+
+from dataclasses import asdict, dataclass, field, fields
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class BackgroundConfig:
+    """Step 1: background video settings"""
+    duration: int = 120
+    num_clips: Optional[int] = None
+    effect_type: str = 'cinematic'
+    transition_duration: float = 1.5
+    transition_type: str = 'crossfade'
+    use_cache: bool = True
+    hwaccel: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class ContentConfig:
+    """Step 2: Reddit scraping settings"""
+    subreddits: List[str] = field(default_factory=lambda: [
+        'GetMotivated', 'motivation', 'wholesomememes', 'LifeProTips',
+        'decidingtobebetter', 'selfimprovement', 'quotes', 'productivity',
+        'findapath', 'UpliftingNews'
+    ])
+    posts_per_sub: int = 25
+    min_reading_time: int = 30
+    max_reading_time: int = 180
+    workers: int = 4
+
+
+@dataclass(frozen=True, slots=True)
+class RedditConfig:
+    """Reddit API client settings (credentials come from the environment)"""
+    user_agent: str = 'InstagramReelPipeline/1.0 by ReelCreator'
+
+
+@dataclass(frozen=True, slots=True)
+class ReelsConfig:
+    """Step 3: reel creation settings"""
+    num_reels: int = 5
+    language: str = 'a'
+    voice: str = 'af_heart'
+    text_style: str = 'modern'
+    text_animation: str = 'fade'
+    voice_speed: float = 1.0
+    max_duration: int = 90
+    tts_cache: bool = True
+    workers: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineConfig:
+    """Complete pipeline configuration"""
+    output_folder: str = 'instagram_pipeline_output'
+    stock_videos_folder: str = 'StockVideos'
+    skip_background: bool = False
+    skip_scraping: bool = False
+    existing_background_video: Optional[str] = None
+    existing_content_file: Optional[str] = None
+    background: BackgroundConfig = field(default_factory=BackgroundConfig)
+    content: ContentConfig = field(default_factory=ContentConfig)
+    reddit: RedditConfig = field(default_factory=RedditConfig)
+    reels: ReelsConfig = field(default_factory=ReelsConfig)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PipelineConfig':
+        """
+        Build a config from its JSON form; missing keys take their defaults
+
+        Raises:
+            ValueError: If a section or key is not a known setting
+        """
+        data = dict(data)
+        sections = {
+            'background': BackgroundConfig,
+            'content': ContentConfig,
+            'reddit': RedditConfig,
+            'reels': ReelsConfig
+        }
+        for name, section_cls in sections.items():
+            if name in data:
+                data[name] = _build(section_cls, data[name], name)
+        return _build(cls, data, 'config')
+
+    def to_dict(self) -> Dict:
+        """JSON form of the config (the inverse of from_dict)"""
+        return asdict(self)
+
+
+def _build(cls, values, name):
+    """Instantiate a config dataclass, rejecting keys it does not define"""
+    if not isinstance(values, dict):
+        raise ValueError(f"Config section '{name}' must be an object")
+    unknown = set(values) - {f.name for f in fields(cls)}
+    if unknown:
+        raise ValueError(f"Unknown setting(s) in '{name}': {', '.join(sorted(unknown))}")
+    return cls(**values)
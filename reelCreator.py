@@ -10,20 +10,36 @@ import csv
 import random
 import tempfile
 import shutil
+import threading
+import functools
+import hashlib
+import multiprocessing
+import inspect
+import logging
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 import argparse
 from pathlib import Path
-import textwrap
 import time
 import subprocess
 import sys
+from typing import Tuple
 
 # Third-party imports
 import numpy as np
 import soundfile as sf
 from PIL import Image, ImageDraw, ImageFont
-from moviepy.editor import *
-import torch
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: faster JSON loading, stdlib json otherwise
+
+# MoviePy (and Kokoro, which pulls in torch) are imported where they are
+# first used, so --list-voices and ffmpeg-only renders skip their start-up cost.
+# Importing moviepy.editor also attaches the fx methods (resize, fadein...) to clips.
 
 # Fix PIL compatibility issue
 try:
@@ -40,7 +56,177 @@ except (AttributeError, ImportError):
     # For older Pillow versions, these should already exist
     pass
 
-from kokoro.__main__ import generate_and_save_audio
+from ffmpegUtils import (detect_h264_encoder, encoder_args, encoder_settings,
+                         probe_video, run_ffmpeg)
+
+log = logging.getLogger(__name__)
+
+# Frame rate of exported reels
+REEL_FPS = 30
+
+# Kokoro generates 24 kHz mono audio
+TTS_SAMPLE_RATE = 24000
+
+# ImageDraw.text gained stroke_width/stroke_fill in Pillow 6.2
+PIL_HAS_STROKE = 'stroke_width' in inspect.signature(ImageDraw.ImageDraw.text).parameters
+
+def dilate_mask(mask, radius):
+    """
+    Square dilation of a 2-D uint8 mask (what MaxFilter(2 * radius + 1) does),
+    separated into a horizontal and a vertical max pass. Each pass doubles the
+    window it covers per step, so it takes O(log radius) vectorized steps.
+    """
+    size = 2 * radius + 1
+    dilated = np.pad(mask, radius)
+    for axis in (1, 0):
+        # After each step, index j holds the max of the `covered` values from j on
+        view = np.moveaxis(dilated, axis, 0)
+        covered = 1
+        while covered < size:
+            step = min(covered, size - covered)
+            np.maximum(view[:-step], view[step:], out=view[:-step])
+            covered += step
+    height, width = mask.shape
+    return dilated[:height, :width].copy()
+
+# Candidate fonts, best first
+FONT_PATHS = (
+    # Windows fonts
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/calibri.ttf",
+    "C:/Windows/Fonts/arialbd.ttf",
+    # macOS fonts  
+    "/System/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/Library/Fonts/Arial.ttf",
+    # Linux fonts
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
+)
+
+@functools.lru_cache(maxsize=None)
+def resolve_font_path():
+    """First candidate font that loads on this machine ('' if none does); probed once"""
+    for font_path in FONT_PATHS:
+        try:
+            if os.path.exists(font_path):
+                ImageFont.truetype(font_path, 12)
+                return font_path
+        except Exception as e:
+            log.warning(f"⚠️ Could not load font {font_path}: {e}")
+            continue
+    return ''
+
+@functools.lru_cache(maxsize=32)
+def load_font(size):
+    """
+    Best available font at this size, parsed once per process
+    
+    Raises:
+        RuntimeError: If no scalable font is available; Pillow's 10px bitmap
+                      default is unreadable on a 1080x1920 reel
+    """
+    font_path = resolve_font_path()
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    
+    # Pillow embeds a scalable default font, but only when built with FreeType;
+    # without it load_default silently returns the bitmap font
+    font = ImageFont.load_default(size)
+    if not isinstance(font, ImageFont.FreeTypeFont):
+        raise RuntimeError(f"No TrueType font found (tried {', '.join(FONT_PATHS)}) "
+                           "and this Pillow was built without FreeType")
+    return font
+
+class GlyphAdvances(dict):
+    """
+    Advance width of each character in a font, measured on first use. The
+    printable ASCII advances are also measured up front into a 128-entry
+    array indexed by code point, for vectorized line layout.
+    """
+    
+    def __init__(self, font):
+        super().__init__()
+        if hasattr(font, 'getlength'):
+            self.measure = font.getlength
+        else:
+            # Pillow < 8 only has getsize
+            self.measure = lambda ch: font.getsize(ch)[0]
+        self.ascii = np.zeros(128, dtype=np.float32)
+        for code in range(32, 127):
+            self.ascii[code] = self[chr(code)]
+    
+    def __missing__(self, ch):
+        advance = self[ch] = self.measure(ch)
+        return advance
+
+@functools.lru_cache(maxsize=32)
+def glyph_advances(size):
+    """Shared advance table for load_font(size)"""
+    return GlyphAdvances(load_font(size))
+
+@dataclass(frozen=True, slots=True)
+class TextStyle:
+    """Text style preset for subtitles"""
+    font_size: int
+    color: Tuple[int, int, int]
+    stroke_color: Tuple[int, int, int]
+    stroke_width: int
+    bg_opacity: float
+
+TEXT_STYLES = {
+    'modern': TextStyle(
+        font_size=60,
+        color=(255, 255, 255),          # White
+        stroke_color=(0, 0, 0),         # Black
+        stroke_width=3,
+        bg_opacity=0.7
+    ),
+    'elegant': TextStyle(
+        font_size=55,
+        color=(255, 255, 255),          # White
+        stroke_color=(25, 25, 112),     # Navy
+        stroke_width=2,
+        bg_opacity=0.6
+    ),
+    'bold': TextStyle(
+        font_size=70,
+        color=(255, 255, 0),            # Yellow
+        stroke_color=(0, 0, 0),         # Black
+        stroke_width=4,
+        bg_opacity=0.8
+    ),
+    'minimal': TextStyle(
+        font_size=50,
+        color=(255, 255, 255),          # White
+        stroke_color=(128, 128, 128),   # Gray
+        stroke_width=1,
+        bg_opacity=0.5
+    ),
+    'vibrant': TextStyle(
+        font_size=65,
+        color=(255, 215, 0),            # Gold
+        stroke_color=(139, 69, 19),     # Brown
+        stroke_width=3,
+        bg_opacity=0.7
+    )
+}
+
+# Kokoro voices offered by --list-voices
+KOKORO_VOICES = (
+    "af_heart",    # American 
+    "af_bella",    # American Female - Bella
+    "af_sarah",    # American Female - Sarah  
+    "af_nicole",   # American Female - Nicole
+    "am_adam",     # American Male - Adam
+    "am_michael",  # American Male - Michael
+    "bf_emma",     # British Female - Emma
+    "bf_isabella", # British Female - Isabella
+    "bm_lewis",    # British Male - Lewis
+    "bm_george"    # British Male - George
+)
 
 class ReelTextRenderer:
     """Handle text styling and rendering for reels"""
@@ -49,153 +235,174 @@ class ReelTextRenderer:
         self.width = width
         self.height = height
         
+        # Widest a subtitle line may get before it wraps, in pixels
+        self.max_line_width = int(width * 0.75)
+        
         # Text style presets
-        self.styles = {
-            'modern': {
-                'font_size': 60,
-                'color': (255, 255, 255),      # White
-                'stroke_color': (0, 0, 0),     # Black
-                'stroke_width': 3,
-                'bg_opacity': 0.7
-            },
-            'elegant': {
-                'font_size': 55,
-                'color': (255, 255, 255),      # White  
-                'stroke_color': (25, 25, 112),  # Navy
-                'stroke_width': 2,
-                'bg_opacity': 0.6
-            },
-            'bold': {
-                'font_size': 70,
-                'color': (255, 255, 0),        # Yellow
-                'stroke_color': (0, 0, 0),     # Black
-                'stroke_width': 4,
-                'bg_opacity': 0.8
-            },
-            'minimal': {
-                'font_size': 50,
-                'color': (255, 255, 255),      # White
-                'stroke_color': (128, 128, 128), # Gray
-                'stroke_width': 1,
-                'bg_opacity': 0.5
-            },
-            'vibrant': {
-                'font_size': 65,
-                'color': (255, 215, 0),        # Gold
-                'stroke_color': (139, 69, 19),  # Brown
-                'stroke_width': 3,
-                'bg_opacity': 0.7
-            }
-        }
+        self.styles = TEXT_STYLES
+        
+        # Load every preset's font up front, so a missing font fails here
+        # rather than after a voice-over has been generated
+        for style in self.styles.values():
+            self.get_font(style.font_size)
+        
+        # Rendered chunks by (text, style); titles and common phrases repeat
+        # across the reels of a batch
+        self.render_text_layers = functools.lru_cache(maxsize=512)(self._render_text_layers)
     
     def get_font(self, size):
         """Get the best available font"""
-        font_paths = [
-            # Windows fonts
-            "C:/Windows/Fonts/arial.ttf",
-            "C:/Windows/Fonts/calibri.ttf",
-            "C:/Windows/Fonts/arialbd.ttf",
-            # macOS fonts  
-            "/System/Library/Fonts/Arial.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/Library/Fonts/Arial.ttf",
-            # Linux fonts
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf"
-        ]
-        
-        for font_path in font_paths:
-            try:
-                if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, size)
-            except Exception as e:
-                print(f"⚠️ Could not load font {font_path}: {e}")
-                continue
+        return load_font(size)
+    
+    def wrap_text(self, text, font_size):
+        """
+        Greedy word wrap by rendered width instead of character count
         
-        # Fallback to default font
-        try:
-            return ImageFont.load_default()
-        except Exception as e:
-            print(f"⚠️ Could not load default font: {e}")
-            return None
+        Returns:
+            List of (line, width) pairs, widths summed from the font's
+            per-character advances rather than measured per line
+        """
+        words = text.split()
+        if not words:
+            return []
+        advances = glyph_advances(font_size)
+        if text.isascii():
+            # Look up every character's advance at once and sum them per word
+            codes = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+            word_starts = np.cumsum([0] + [len(word) for word in words[:-1]])
+            word_widths = np.add.reduceat(advances.ascii[codes], word_starts).tolist()
+        else:
+            word_widths = [sum(map(advances.__getitem__, word)) for word in words]
+        
+        space = advances[' ']
+        lines = []
+        line, line_width = [], 0
+        for word, word_width in zip(words, word_widths):
+            if line and line_width + space + word_width > self.max_line_width:
+                lines.append((' '.join(line), line_width))
+                line, line_width = [], 0
+            if line:
+                line_width += space
+            line.append(word)
+            line_width += word_width
+        if line:
+            lines.append((' '.join(line), line_width))
+        return lines
     
     def create_text_image(self, text, style_name='modern'):
-        """Create a text image with the specified style"""
+        """
+        Create a text image with the specified style. The image is only as
+        large as the text, so compositors blend a fraction of the pixels;
+        center it on the frame to place it.
+        """
         style = self.styles.get(style_name, self.styles['modern'])
         
-        # Create image with transparent background
-        img_height = 300
-        img = Image.new('RGBA', (self.width, img_height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
         # Get font
-        font = self.get_font(style['font_size'])
-        if not font:
-            return self._create_fallback_image(text, style, img_height)
+        font = self.get_font(style.font_size)
         
-        # Wrap text to fit width
-        wrapped_text = textwrap.fill(text, width=20)
-        lines = wrapped_text.split('\n')
+        # Wrap text to fit width; the advance sums size the image
+        lines = self.wrap_text(text, style.font_size) or [('', 0)]
+        stroke_width = style.stroke_width
         
-        # Calculate text positioning
-        line_spacing = style['font_size'] + 10
-        total_height = len(lines) * line_spacing
-        y_start = (img_height - total_height) // 2
+        # Room for the outline and descenders around the text
+        margin = stroke_width + 10
+        line_spacing = style.font_size + 10
+        img_width = round(max(width for _, width in lines)) + 2 * margin
+        img = Image.new('RGBA', (img_width, len(lines) * line_spacing + 2 * margin), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        
+        placed_lines = [(round((img_width - text_width) / 2), margin + i * line_spacing, line)
+                        for i, (line, text_width) in enumerate(lines)
+                        if line]
+        
+        if not PIL_HAS_STROKE:
+            return self._draw_dilated_stroke(img, placed_lines, font, style)
         
         # Draw text with stroke effect
-        for i, line in enumerate(lines):
-            if not line.strip():
-                continue
-                
-            # Get text dimensions
-            try:
-                bbox = draw.textbbox((0, 0), line, font=font)
-                text_width = bbox[2] - bbox[0]
-            except AttributeError:
-                # Fallback for older Pillow versions
-                text_width, text_height = draw.textsize(line, font=font)
-            
-            x = (self.width - text_width) // 2
-            y = y_start + i * line_spacing
-            
-            # Draw stroke (outline)
-            stroke_width = style['stroke_width']
-            for dx in range(-stroke_width, stroke_width + 1):
-                for dy in range(-stroke_width, stroke_width + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), line, 
-                                font=font, fill=style['stroke_color'])
-            
-            # Draw main text
-            draw.text((x, y), line, font=font, fill=style['color'])
+        for x, y, line in placed_lines:
+            # Text and outline in one call; Pillow rasterizes the glyphs once
+            # and strokes them itself
+            draw.text((x, y), line, font=font, fill=style.color,
+                      stroke_width=stroke_width, stroke_fill=style.stroke_color)
         
         return img
     
-    def _create_fallback_image(self, text, style, img_height):
-        """Create simple text fallback when fonts aren't available"""
-        img = Image.new('RGBA', (self.width, img_height), (0, 0, 0, 180))
-        draw = ImageDraw.Draw(img)
+    def _draw_dilated_stroke(self, img, placed_lines, font, style):
+        """
+        Outline text on Pillow versions without native stroke support: render
+        the glyphs once into a mask and dilate it for the outline
+        """
+        mask = Image.new('L', img.size, 0)
+        mask_draw = ImageDraw.Draw(mask)
+        for x, y, line in placed_lines:
+            mask_draw.text((x, y), line, font=font, fill=255)
         
-        # Simple text rendering without custom fonts
-        lines = textwrap.fill(text, width=30).split('\n')
-        y_pos = img_height // 4
+        stroke_mask = Image.fromarray(dilate_mask(np.asarray(mask), style.stroke_width))
+        img.paste(style.stroke_color + (255,), (0, 0), stroke_mask)
+        img.paste(style.color + (255,), (0, 0), mask)
+        return img
+    
+    def _render_text_layers(self, text, style_name):
+        """
+        Subtitle (text over its background strip) split once into the layers
+        MoviePy composites with, shared by every clip that shows it
         
-        for line in lines[:4]:  # Limit to 4 lines
-            if line.strip():
-                draw.text((50, y_pos), line[:60], fill=(255, 255, 255))
-                y_pos += 40
+        Returns:
+            (rgb, alpha): read-only uint8 color planes and a float32 opacity
+            mask in [0, 1]
+        """
+        text_img = self.create_overlay_image(text, style_name)
+        if text_img.mode != 'RGBA':
+            text_img = text_img.convert('RGBA')
+        # asarray wraps the single tobytes copy from Pillow's array interface,
+        # and the color planes stay a view of it; MoviePy only reads them
+        img_array = np.asarray(text_img)
+        rgb = img_array[:, :, :3]
+        # float32 halves the mask's size against the float64 that
+        # ImageClip(transparent=True) builds for every clip; converted and
+        # scaled in one pass
+        alpha = np.multiply(img_array[:, :, 3], np.float32(1 / 255), dtype=np.float32)
+        rgb.flags.writeable = False
+        alpha.flags.writeable = False
+        return rgb, alpha
+    
+    def chunk_text(self, text, chunk_size=8, *, words=None):
+        """
+        Split text into chunks of chunk_size words for better readability
         
-        return img
+        Args:
+            words: text already split into words, to skip splitting it again
+        """
+        if words is None:
+            words = text.split()
+        return [' '.join(words[i:i + chunk_size]) 
+                for i in range(0, len(words), chunk_size)]
     
-    def create_text_clips(self, text, duration, style='modern', animation='fade'):
-        """Create animated text clips for the reel"""
-        # Split text into chunks for better readability
-        words = text.split()
-        chunk_size = 8  # Words per chunk
-        chunks = [' '.join(words[i:i + chunk_size]) 
-                 for i in range(0, len(words), chunk_size)]
+    def create_overlay_image(self, text, style_name='modern', strip_height=250, strip_opacity=0.6):
+        """
+        Full-width text image with the semi-transparent subtitle strip baked in
+        underneath, for compositors that overlay one RGBA image per chunk
+        """
+        text_img = self.create_text_image(text, style_name)
+        height = max(strip_height, text_img.height)
+        overlay = Image.new('RGBA', (self.width, height), (0, 0, 0, 0))
+        strip_top = (height - strip_height) // 2
+        overlay.paste((0, 0, 0, round(255 * strip_opacity)),
+                      (0, strip_top, self.width, strip_top + strip_height))
+        overlay.alpha_composite(text_img, (max(0, (self.width - text_img.width) // 2),
+                                           (height - text_img.height) // 2))
+        return overlay
+    
+    def create_text_clips(self, text, duration, style='modern', animation='fade', *, words=None):
+        """
+        Create animated text clips for the reel
+        
+        Args:
+            words: text already split into words, to skip splitting it again
+        """
+        from moviepy.editor import ColorClip, ImageClip
+        
+        chunks = self.chunk_text(text, words=words)
         
         if not chunks:
             return []
@@ -208,11 +415,11 @@ class ReelTextRenderer:
             
             try:
                 # Create text image
-                text_img = self.create_text_image(chunk, style)
-                img_array = np.array(text_img)
+                rgb, alpha = self.render_text_layers(chunk, style)
                 
                 # Create video clip
-                img_clip = ImageClip(img_array, duration=chunk_duration, transparent=True)
+                img_clip = ImageClip(rgb, duration=chunk_duration).set_mask(
+                    ImageClip(alpha, ismask=True, duration=chunk_duration))
                 img_clip = img_clip.set_position('center').set_start(start_time)
                 
                 # Apply animation
@@ -220,7 +427,7 @@ class ReelTextRenderer:
                 text_clips.append(img_clip)
                 
             except Exception as e:
-                print(f"⚠️ Error creating text clip {i+1}: {e}")
+                log.warning(f"⚠️ Error creating text clip {i+1}: {e}")
                 # Create a simple colored rectangle as fallback
                 fallback_clip = ColorClip(
                     size=(800, 100), 
@@ -243,21 +450,26 @@ class ReelTextRenderer:
                     clip = clip.fadeout(0.3)
                     
             elif animation == 'slide':
-                # Slide up from bottom
+                # Slide up from 200px below center over the first 0.5s; the
+                # positions are tabulated per frame, so each frame is one lookup
+                x = (self.width - clip.w) // 2
+                y = (self.height - clip.h) // 2
+                slide_frames = int(0.5 * REEL_FPS)
+                y_positions = (y + np.rint(np.linspace(200, 0, slide_frames, endpoint=False))
+                               ).astype(int).tolist()
                 def slide_position(t):
-                    if t < 0.5:
-                        progress = t / 0.5
-                        y_offset = (1 - progress) * 200
-                        return ('center', f'center+{y_offset}')
-                    return 'center'
+                    frame = int(t * REEL_FPS)
+                    return (x, y_positions[frame] if frame < slide_frames else y)
                 clip = clip.set_position(slide_position)
                 
             elif animation == 'zoom':
-                # Subtle zoom effect
-                clip = clip.resize(lambda t: min(1 + t * 0.05, 1.05))
+                # Subtle zoom effect: 5% over the first second, tabulated per frame
+                zoom_frames = REEL_FPS + 1
+                scales = np.minimum(1 + np.arange(zoom_frames) / REEL_FPS * 0.05, 1.05).tolist()
+                clip = clip.resize(lambda t: scales[min(int(t * REEL_FPS), zoom_frames - 1)])
         
         except Exception as e:
-            print(f"⚠️ Animation error: {e}")
+            log.warning(f"⚠️ Animation error: {e}")
             # Return clip without animation as fallback
         
         return clip
@@ -265,18 +477,42 @@ class ReelTextRenderer:
 class InstagramReelCreator:
     """Main class for creating Instagram Reels"""
     
-    def __init__(self, output_folder="instagram_reels"):
+    def __init__(self, output_folder="instagram_reels", tts_cache_folder=None, temp_dir=None,
+                 hwaccel=None, encoder=None, torch_threads=None):
         self.output_folder = Path(output_folder)
-        self.temp_folder = Path(tempfile.mkdtemp(prefix="reel_temp_"))
+        # H.264 encoder for exported reels; hardware encoders are preferred when
+        # none is given (detection is cached, so worker processes pass it on)
+        self.encoder = encoder or detect_h264_encoder()
+        # 'cuda' composites fade-animated reels entirely on the GPU
+        self.hwaccel = hwaccel
+        self.temp_folder = Path(tempfile.mkdtemp(prefix="reel_temp_", dir=temp_dir))
+        # Synthesized voice-overs are reused when the same text/voice comes up again
+        self.tts_cache_folder = Path(tts_cache_folder) if tts_cache_folder else None
+        # torch intra-op threads for TTS (default: torch's own, one per core)
+        self.torch_threads = torch_threads
         
         # Create output folder
         self.output_folder.mkdir(exist_ok=True)
+        if self.tts_cache_folder:
+            self.tts_cache_folder.mkdir(parents=True, exist_ok=True)
         
         # Initialize components
         self.text_renderer = ReelTextRenderer()
+        # Kokoro pipelines by language, loaded on first use and shared by every reel
+        self._tts_pipelines = {}
+        # Kokoro (and its misaki/espeak G2P) is not thread-safe, and voice-overs
+        # can be generated on a prefetch thread and a render thread at once
+        self._tts_lock = threading.Lock()
+        # Open background videos; every reel takes a subclip of the same reader
+        self._background_clips = {}
+        # Background durations, probed once for the ffmpeg compositor
+        self._background_durations = {}
+        # Subtitle overlay PNGs by (text, style), written once per creator
+        self._overlay_files = {}
         
-        print(f"📁 Output folder: {self.output_folder}")
-        print(f"🔧 Temp folder: {self.temp_folder}")
+        log.info(f"📁 Output folder: {self.output_folder}")
+        log.info(f"🔧 Temp folder: {self.temp_folder}")
+        log.info(f"🎞️  Video encoder: {self.encoder}")
     
     def load_content(self, file_path):
         """Load content from JSON or CSV file"""
@@ -288,91 +524,321 @@ class InstagramReelCreator:
         content = []
         
         if file_path.suffix.lower() == '.json':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = json.load(f)
+            if orjson is not None:
+                content = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = json.load(f)
         elif file_path.suffix.lower() == '.csv':
-            with open(file_path, 'r', encoding='utf-8') as f:
+            # Large reads instead of the default 8 KiB ones
+            with open(file_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
                 content = list(csv.DictReader(f))
         else:
             raise ValueError("Content file must be JSON or CSV format")
         
-        print(f"📚 Loaded {len(content)} content items")
+        log.info(f"📚 Loaded {len(content)} content items")
         return content
     
-    def list_voices(self):
-        """List all available Kokoro voices"""
-        voices = [
-            "af_heart",    # American 
-            "af_bella",    # American Female - Bella
-            "af_sarah",    # American Female - Sarah  
-            "af_nicole",   # American Female - Nicole
-            "am_adam",     # American Male - Adam
-            "am_michael",  # American Male - Michael
-            "bf_emma",     # British Female - Emma
-            "bf_isabella", # British Female - Isabella
-            "bm_lewis",    # British Male - Lewis
-            "bm_george"    # British Male - George
-        ]
-
+    @staticmethod
+    def list_voices():
+        """List all available Kokoro voices (needs no creator instance)"""
         print("Available Kokoro voices:")
-        for voice in voices:
+        for voice in KOKORO_VOICES:
             print(f"  - {voice}")
 
+    def tts_cache_path(self, text, lang, voice, speed):
+        """Cache file for a voice-over, keyed by everything that affects the audio"""
+        key = hashlib.sha256(
+            json.dumps([text, lang, voice, speed], ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        return self.tts_cache_folder / f"{key}.wav"
+    
+    def get_tts_pipeline(self, lang='a'):
+        """Kokoro pipeline for a language; the model is loaded once and reused"""
+        if lang not in self._tts_pipelines:
+            from kokoro import KPipeline
+            if self.torch_threads:
+                import torch
+                torch.set_num_threads(self.torch_threads)
+            self._tts_pipelines[lang] = KPipeline(lang_code=lang)
+        return self._tts_pipelines[lang]
+    
+    def split_for_tts(self, text, max_chars=300):
+        """
+        Split text into sentence groups of at most max_chars characters; Kokoro
+        handles short inputs best and keeps its peak memory low on them
+        """
+        chunks = []
+        current = ''
+        for sentence in re.split(r'(?<=[.!?])\s+', text.strip()):
+            # Sentences that are too long on their own are split between words
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(' ', 0, max_chars)
+                if cut <= 0:
+                    cut = max_chars
+                if current:
+                    chunks.append(current)
+                    current = ''
+                chunks.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def synthesize_speech(self, text, lang='a', voice='af_heart', speed=1.0):
+        """
+        Generate a voice-over WAV for text, reusing a cached one if available
+        
+        Returns:
+            Path to the WAV file, or None if generation failed
+        """
+        if self.tts_cache_folder:
+            audio_file = self.tts_cache_path(text, lang, voice, speed)
+            if audio_file.exists():
+                log.info("🔊 Reusing cached voice-over")
+                return audio_file
+            # Write next to the cache entry and rename, so a crash never
+            # leaves a truncated file under the final name
+            output_file = audio_file.with_suffix('.partial.wav')
+        else:
+            audio_file = output_file = self.temp_folder / "temp_audio.wav"
+        
+        try:
+            sf.write(str(output_file), self._generate_audio(text, lang, voice, speed),
+                     TTS_SAMPLE_RATE)
+        except Exception as e:
+            log.warning(f"⚠️ Audio generation failed: {e}")
+            return None
+        
+        if output_file != audio_file:
+            os.replace(output_file, audio_file)
+        return audio_file
+    
+    def _generate_audio(self, text, lang, voice, speed):
+        """Run Kokoro over the text in short chunks and join the samples"""
+        segments = []
+        with self._tts_lock:
+            pipeline = self.get_tts_pipeline(lang)
+            for chunk in self.split_for_tts(text):
+                for result in pipeline(chunk, voice=voice, speed=speed, split_pattern=None):
+                    if result.audio is not None:
+                        segments.append(np.asarray(result.audio, dtype=np.float32))
+        if not segments:
+            raise ValueError("Kokoro returned no audio")
+        return np.concatenate(segments)
+    
+    def prepare_text(self, content_item, verbose=True):
+        """
+        Build the narration text for a content item
+        
+        Returns:
+            (full_text, words) with full_text capped at ~200 words and words
+            being full_text split on whitespace
+        """
+        # Extract text content
+        title = content_item.get('title', '')
+        content_text = content_item.get('content', '') or content_item.get('text', '')
+        
+        # Combine and clean text
+        full_text = f"{title}. {content_text}".strip()
+        if not full_text or full_text == '.':
+            raise ValueError("No valid text content found")
+        
+        # Limit text length
+        words = full_text.split()
+        if verbose:
+            log.info(f"📝 Text: {len(words)} words")
+        if len(words) > 200:  # Limit to ~200 words
+            words = words[:200]
+            words[-1] += '...'
+            full_text = ' '.join(words)
+        
+        return full_text, words
+    
+    def create_single_reel_ffmpeg(self, background_video, content_item, output_file, lang='a',
+                                  voice='af_heart', style='modern', animation='fade',
+                                  voice_speed=1.0, max_duration=90, use_cuda=False):
+        """
+        Create and export a reel in one ffmpeg run: scale the background, overlay
+        each text chunk as a pre-rendered PNG and encode, without MoviePy
+        compositing frames in Python. Text positions are static, so only the
+        'fade' animation is supported.
+        
+        Args:
+            use_cuda: Stay on the GPU (NVDEC decode, scale_cuda, overlay_cuda,
+                      NVENC encode)
+        
+        Returns:
+            Reel duration in seconds, or None on failure
+        """
+        try:
+            full_text, words = self.prepare_text(content_item)
+            
+            # Generate voice-over and determine duration
+            audio_file = self.synthesize_speech(full_text, lang, voice, voice_speed)
+            if audio_file and audio_file.exists():
+                target_duration = min(sf.info(str(audio_file)).duration, max_duration)
+            else:
+                audio_file = None
+                target_duration = min(len(words) / 2.5, max_duration)
+            
+            log.info(f"⏱️  Target duration: {target_duration:.1f}s")
+            
+            # Random background segment, or loop it if it is too short
+            bg_duration = self.get_background_duration(background_video)
+            if bg_duration > target_duration:
+                seek = ['-ss', f"{random.uniform(0, bg_duration - target_duration):.3f}"]
+            else:
+                seek = ['-stream_loop', '-1']
+            inputs = seek + ['-i', str(background_video)]
+            if use_cuda:
+                inputs = ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'] + inputs
+                filters = ['[0:v]scale_cuda=1080:1920[v0]']
+                upload, overlay_filter = ',hwupload_cuda', 'overlay_cuda'
+            else:
+                filters = ['[0:v]scale=1080:1920,setsar=1[v0]']
+                upload, overlay_filter = '', 'overlay'
+            
+            log.info("✏️  Creating text overlays...")
+            chunks = self.text_renderer.chunk_text(full_text, words=words)
+            chunk_duration = target_duration / len(chunks)
+            for i, chunk in enumerate(chunks):
+                overlay_path, overlay_height = self.get_overlay_file(chunk, style)
+                inputs += ['-loop', '1', '-framerate', str(REEL_FPS), '-t', f"{chunk_duration:.3f}",
+                           '-i', str(overlay_path)]
+                
+                # Same fade timings as the MoviePy path, applied to the overlay's alpha
+                fade_out = 0.5 if i == len(chunks) - 1 else 0.3
+                fades = f"fade=t=out:st={max(0, chunk_duration - fade_out):.3f}:d={fade_out}:alpha=1"
+                if i == 0:
+                    fades = "fade=t=in:st=0:d=0.5:alpha=1," + fades
+                y = (1920 - overlay_height) // 2
+                filters.append(f"[{i + 1}:v]format=yuva420p,{fades},"
+                               f"setpts=PTS+{i * chunk_duration:.3f}/TB{upload}[t{i}]")
+                filters.append(f"[v{i}][t{i}]{overlay_filter}=x=0:y={y}:"
+                               f"eof_action=pass:repeatlast=0[v{i + 1}]")
+            
+            outputs = ['-filter_complex', ';'.join(filters), '-map', f"[v{len(chunks)}]"]
+            if audio_file:
+                inputs += ['-i', str(audio_file)]
+                outputs += ['-map', f"{len(chunks) + 1}:a", '-c:a', 'aac']
+            else:
+                outputs += ['-an']
+            
+            outputs += ['-t', f"{target_duration:.3f}", '-r', str(REEL_FPS)]
+            if use_cuda:
+                # Frames are CUDA surfaces here, so no -pix_fmt conversion on the encoder
+                outputs += ['-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', '23',
+                            '-b:v', '0']
+            else:
+                outputs += encoder_args(self.encoder, quality=23, fast=True)
+            outputs += ['-movflags', '+faststart', str(output_file)]
+            
+            log.info(f"💾 Exporting{' on GPU' if use_cuda else ''}: {Path(output_file).name}")
+            run_ffmpeg(inputs + outputs)
+            return target_duration
+            
+        except Exception as e:
+            log.warning(f"⚠️ {'GPU' if use_cuda else 'ffmpeg'} compositing failed: {e}")
+            return None
+    
+    def prepare_background(self, background_video):
+        """
+        Background video at reel resolution. Other sizes are scaled once here,
+        so reels don't rescale every frame of it again.
+        
+        Returns:
+            Path of a 1080x1920 background (the original if it already is)
+        """
+        _, width, height = probe_video(str(background_video))
+        if (width, height) == (1080, 1920):
+            return background_video
+        
+        log.info(f"📐 Scaling background from {width}x{height} to 1080x1920 for the batch...")
+        scaled_video = self.temp_folder / "background_1080x1920.mp4"
+        try:
+            run_ffmpeg(['-i', str(background_video), '-vf', 'scale=1080:1920,setsar=1']
+                       + encoder_args(self.encoder, quality=18, fast=True)
+                       + ['-c:a', 'copy', str(scaled_video)])
+        except RuntimeError as e:
+            log.warning(f"⚠️ Background scaling failed, reels will scale it themselves: {e}")
+            return background_video
+        return scaled_video
+    
+    def get_overlay_file(self, text, style='modern'):
+        """
+        Subtitle overlay PNG for the ffmpeg compositor, rendered once per
+        (text, style) and reused by every reel that shows it
+        
+        Returns:
+            (path, height) of the full-width overlay image
+        """
+        key = (text, style)
+        if key not in self._overlay_files:
+            overlay = self.text_renderer.create_overlay_image(text, style)
+            # Named by content so concurrent prerender threads never share a file
+            digest = hashlib.sha1(f"{style}\0{text}".encode('utf-8')).hexdigest()[:16]
+            overlay_path = self.temp_folder / f"overlay_{digest}.png"
+            # Light compression: the file only lives as long as the batch
+            overlay.save(overlay_path, compress_level=1)
+            self._overlay_files[key] = (overlay_path, overlay.height)
+        return self._overlay_files[key]
+    
+    def get_background_duration(self, background_video):
+        """Background video duration, probed once per creator instead of once per reel"""
+        key = str(background_video)
+        if key not in self._background_durations:
+            if key in self._background_clips:
+                self._background_durations[key] = self._background_clips[key].duration
+            else:
+                self._background_durations[key] = probe_video(key)[0]
+        return self._background_durations[key]
+    
+    def get_background_clip(self, background_video):
+        """Background video opened once per creator instead of once per reel"""
+        key = str(background_video)
+        if key not in self._background_clips:
+            from moviepy.editor import VideoFileClip
+            self._background_clips[key] = VideoFileClip(key)
+        return self._background_clips[key]
+    
     def create_single_reel(self, background_video, content_item, lang='a',
                           voice='af_heart', style='modern', animation='fade', 
                           voice_speed=1.0, max_duration=90):
-        """Create a single Instagram Reel"""
+        """
+        Create a single Instagram Reel
+        
+        Returns:
+            (video, audio_file): the silent composited clip and the voice-over
+            WAV to mux into it (None without one), or None on failure
+        """
+        from moviepy.editor import CompositeVideoClip
         
         try:
             # Load and prepare background video
-            print(f"🎬 Processing background video...")
-            bg_video = VideoFileClip(str(background_video))
-            
-            # Extract text content
-            title = content_item.get('title', '')
-            content_text = content_item.get('content', '') or content_item.get('text', '')
+            log.info(f"🎬 Processing background video...")
+            bg_video = self.get_background_clip(background_video)
             
-            # Combine and clean text
-            full_text = f"{title}. {content_text}".strip()
-            if not full_text or full_text == '.':
-                raise ValueError("No valid text content found")
+            full_text, words = self.prepare_text(content_item)
             
-            # Limit text length
-            words = full_text.split()
-            if len(words) > 200:  # Limit to ~200 words
-                full_text = ' '.join(words[:200]) + '...'
+            # Generate voice-over; ffmpeg muxes it in after MoviePy has
+            # written the video, so it never goes through MoviePy's audio loop
+            audio_file = self.synthesize_speech(full_text, lang, voice, voice_speed)
             
-            print(f"📝 Text: {len(words)} words")
-            
-            # Generate voice-over
-            audio_file = self.temp_folder / "temp_audio.wav"
-            try:
-                generate_and_save_audio(
-                    output_file=audio_file,
-                    text=full_text,
-                    kokoro_language=lang,
-                    voice=voice,
-                    speed=voice_speed
-                )
-            except Exception as e:
-                print(f"⚠️ Audio generation failed: {e}")
-                audio_file = None
-            
-            # Load audio and determine duration
+            # Determine duration
             if audio_file and audio_file.exists():
-                try:
-                    audio_clip = AudioFileClip(str(audio_file))
-                    target_duration = min(audio_clip.duration, max_duration)
-                except Exception as e:
-                    print(f"⚠️ Audio loading failed: {e}")
-                    audio_clip = None
-                    target_duration = min(len(words) / 2.5, max_duration)
+                target_duration = min(sf.info(str(audio_file)).duration, max_duration)
             else:
                 # Estimate duration if audio generation failed
                 target_duration = min(len(words) / 2.5, max_duration)
-                audio_clip = None
+                audio_file = None
             
-            print(f"⏱️  Target duration: {target_duration:.1f}s")
+            log.info(f"⏱️  Target duration: {target_duration:.1f}s")
             
             # Prepare background video
             if bg_video.duration > target_duration:
@@ -383,142 +849,304 @@ class InstagramReelCreator:
                 # Loop if necessary
                 bg_video = bg_video.loop(duration=target_duration)
             
-            # Resize background to Instagram format (9:16) with error handling
-            try:
+            # Resize background to Instagram format (9:16); create_batch_reels
+            # has normally done this once already
+            if tuple(bg_video.size) != (1080, 1920):
                 bg_video = bg_video.resize((1080, 1920))
-            except Exception as e:
-                print(f"⚠️ Video resize error: {e}")
-                # Try alternative resize approach
-                bg_video = bg_video.resize(height=1920).resize(width=1080)
             
             # Create text overlays
-            print("✏️  Creating text overlays...")
+            log.info("✏️  Creating text overlays...")
             text_clips = self.text_renderer.create_text_clips(
-                full_text, target_duration, style=style, animation=animation
+                full_text, target_duration, style=style, animation=animation,
+                words=words
             )
             
-            # Add subtitle backgrounds
-            enhanced_clips = []
-            for text_clip in text_clips:
-                try:
-                    # Semi-transparent background
-                    bg_clip = ColorClip(
-                        size=(1080, 250), 
-                        color=(0, 0, 0),
-                        duration=text_clip.duration
-                    ).set_opacity(0.6).set_position('center').set_start(text_clip.start)
-                    
-                    enhanced_clips.extend([bg_clip, text_clip])
-                except Exception as e:
-                    print(f"⚠️ Error creating background for text clip: {e}")
-                    enhanced_clips.append(text_clip)
-            
-            # Compose final video
-            all_clips = [bg_video] + enhanced_clips
-            final_video = CompositeVideoClip(all_clips, size=(1080, 1920))
-            
-            # Add audio if available
-            if audio_clip:
-                try:
-                    final_video = final_video.set_audio(audio_clip)
-                except Exception as e:
-                    print(f"⚠️ Audio attachment failed: {e}")
-            
+            # Compose final video; the subtitle strips are part of the text
+            # images, so each chunk is a single layer. The full-frame background
+            # is the canvas itself rather than a layer blitted onto a blank one.
+            all_clips = [bg_video] + text_clips
+            final_video = CompositeVideoClip(all_clips, size=(1080, 1920), use_bgclip=True)
             final_video = final_video.set_duration(target_duration)
             
-            return final_video
+            return final_video, audio_file
             
         except Exception as e:
-            print(f"❌ Error creating reel: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"❌ Error creating reel: {e}")
             return None
     
-    def create_batch_reels(self, background_video, content_file, num_reels=1, **kwargs):
-        """Create multiple reels from content file"""
+    def select_content(self, content_file, num_reels=1, skip_titles=None):
+        """
+        Pick random content items for a batch of reels
         
-        # Load content
+        Args:
+            skip_titles: Titles of content already used, left out of the selection
+        """
         content_data = self.load_content(content_file)
+        if skip_titles:
+            skip_titles = set(skip_titles)
+            content_data = [item for item in content_data
+                            if item.get('title', 'Untitled')[:50] not in skip_titles]
         
         if len(content_data) < num_reels:
-            print(f"⚠️  Only {len(content_data)} items available, creating {len(content_data)} reels")
+            log.warning(f"⚠️  Only {len(content_data)} items available, creating {len(content_data)} reels")
             num_reels = len(content_data)
         
+        return random.sample(content_data, num_reels)
+    
+    def synthesize_only(self, content_item, lang='a', voice='af_heart', speed=1.0):
+        """
+        Generate a content item's voice-over without rendering the reel.
+        With a TTS cache, the reel created from this item later reuses it.
+        
+        Returns:
+            Path to the WAV file, or None on failure
+        """
+        try:
+            full_text, _ = self.prepare_text(content_item)
+        except ValueError as e:
+            log.warning(f"⚠️ Skipping voice-over: {e}")
+            return None
+        return self.synthesize_speech(full_text, lang, voice, speed)
+    
+    def prerender_text(self, selected_content, style='modern', animation='fade'):
+        """
+        Render every subtitle chunk of a batch once, up front, on a thread pool
+        
+        Chunks only depend on the text and style, so reels then find them
+        cached instead of rendering them between encodes. Pillow releases the
+        GIL while compositing and PNG-encoding, which lets the threads overlap.
+        """
+        chunks = set()
+        for content_item in selected_content:
+            try:
+                full_text, words = self.prepare_text(content_item, verbose=False)
+            except ValueError:
+                continue
+            chunks.update(self.text_renderer.chunk_text(full_text, words=words))
+        if not chunks:
+            return
+        
+        # Fade reels go through the ffmpeg compositor, which wants PNG files
+        if animation == 'fade':
+            render = self.get_overlay_file
+        else:
+            render = self.text_renderer.render_text_layers
+        with ThreadPoolExecutor(max_workers=min(len(chunks), os.cpu_count() or 1)) as pool:
+            list(pool.map(lambda chunk: render(chunk, style), sorted(chunks)))
+    
+    def create_batch_reels(self, background_video, content_file, num_reels=1, workers=None,
+                           on_reel=None, skip_titles=None, selected_content=None, **kwargs):
+        """
+        Create multiple reels from content file
+        
+        Args:
+            workers: Reels rendered in parallel processes (1 = in this process,
+                     default: half the CPU cores)
+            on_reel: Called with each reel's dict as soon as it is exported
+            skip_titles: Titles of content already used, left out of the selection
+            selected_content: Content items picked in advance by select_content
+            **kwargs: Passed through to create_single_reel
+        """
+        
         # Select random content
-        selected_content = random.sample(content_data, num_reels)
+        if selected_content is None:
+            selected_content = self.select_content(content_file, num_reels, skip_titles)
+        num_reels = len(selected_content)
+        if num_reels:
+            background_video = self.prepare_background(background_video)
+        specs = [(i, num_reels, background_video, content_item, kwargs)
+                 for i, content_item in enumerate(selected_content, 1)]
         
-        created_reels = []
+        def collect(results):
+            created_reels = []
+            for reel in results:
+                if reel:
+                    created_reels.append(reel)
+                    if on_reel:
+                        on_reel(reel)
+            return created_reels
         
-        for i, content_item in enumerate(selected_content, 1):
-            print(f"\n--- Creating Reel {i}/{num_reels} ---")
+        # Each worker runs its own ffmpeg, which keeps about two cores busy
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) // 2)
+        if workers <= 1 or num_reels <= 1:
+            self.prerender_text(selected_content, kwargs.get('style', 'modern'),
+                                kwargs.get('animation', 'fade'))
+            if not self.tts_cache_folder or num_reels <= 1:
+                return collect(_render_with(self, spec) for spec in specs)
             
-            title = content_item.get('title', 'Untitled')[:50]
-            print(f"📄 Title: {title}...")
-            
-            # Create the reel
-            reel_video = self.create_single_reel(
-                background_video, content_item, **kwargs
-            )
-            
-            if reel_video:
-                # Generate filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_title = "".join(c for c in title if c.isalnum() or c in ' -_')
-                safe_title = safe_title.replace(' ', '_')[:20]
+            # Voice the upcoming reels on a background thread while the current
+            # one composites and encodes; each reel waits for its own voice-over
+            # and then finds it in the cache
+            with ThreadPoolExecutor(max_workers=1) as tts_pool:
+                voiceovers = [tts_pool.submit(self.synthesize_only, content_item,
+                                              kwargs.get('lang', 'a'),
+                                              kwargs.get('voice', 'af_heart'),
+                                              kwargs.get('voice_speed', 1.0))
+                              for content_item in selected_content]
                 
-                output_file = self.output_folder / f"reel_{i:02d}_{safe_title}_{timestamp}.mp4"
+                def render_after_voiceover(spec, voiceover):
+                    voiceover.result()
+                    return _render_with(self, spec)
                 
-                # Export video with error handling
-                print(f"💾 Exporting: {output_file.name}")
-                try:
-                    reel_video.write_videofile(
-                        str(output_file),
-                        fps=30,
-                        codec='libx264',
-                        audio_codec='aac',
-                        preset='medium',
-                        ffmpeg_params=['-crf', '23', '-pix_fmt', 'yuv420p'],
-                        verbose=False,
-                        logger=None
-                    )
-                    
-                    created_reels.append({
-                        'file': output_file,
-                        'title': title,
-                        'duration': reel_video.duration
-                    })
-                    
-                    print(f"✅ Reel {i} completed ({reel_video.duration:.1f}s)")
-                    
-                except Exception as e:
-                    print(f"❌ Export failed for reel {i}: {e}")
-                
-                # Cleanup
-                try:
-                    reel_video.close()
-                except:
-                    pass
-                
-            else:
-                print(f"❌ Failed to create reel {i}")
+                return collect(render_after_voiceover(spec, voiceover)
+                               for spec, voiceover in zip(specs, voiceovers))
+        
+        # Each reel is an independent TTS + encode job; every worker gets
+        # its own creator (and TTS model) via the pool initializer. The cores
+        # are split between the workers' torch thread pools, which would
+        # otherwise each start one thread per core.
+        workers = min(workers, num_reels)
+        worker_args = (str(self.output_folder),
+                       str(self.tts_cache_folder) if self.tts_cache_folder else None,
+                       str(self.temp_folder), self.hwaccel, self.encoder,
+                       max(1, (os.cpu_count() or 1) // workers),
+                       logging.getLogger().getEffectiveLevel())
+        # Spawned rather than forked, so no worker inherits torch/CUDA state or
+        # locks held by the TTS prefetch thread (CUDA cannot be re-initialized
+        # in a forked child at all)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_reel_worker,
+                                 initargs=worker_args) as pool:
+            return collect(pool.map(_render_single_reel, specs))
+    
+    def render_reel(self, index, num_reels, background_video, content_item, **kwargs):
+        """
+        Create and export one reel of a batch
+        
+        Returns:
+            Dict with the reel's file, title and duration, or None on failure
+        """
+        log.info(f"\n--- Creating Reel {index}/{num_reels} ---")
+        
+        title = content_item.get('title', 'Untitled')[:50]
+        log.info(f"📄 Title: {title}...")
+        
+        # Generate filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_title = "".join(c for c in title if c.isalnum() or c in ' -_')
+        safe_title = safe_title.replace(' ', '_')[:20]
+        
+        output_file = self.output_folder / f"reel_{index:02d}_{safe_title}_{timestamp}.mp4"
+        
+        # Fades need no per-frame Python, so ffmpeg composites those reels on
+        # its own (on the GPU first with --hwaccel cuda); MoviePy handles the rest
+        if kwargs.get('animation', 'fade') == 'fade':
+            for use_cuda in ((True, False) if self.hwaccel == 'cuda' else (False,)):
+                duration = self.create_single_reel_ffmpeg(
+                    background_video, content_item, output_file, use_cuda=use_cuda, **kwargs
+                )
+                if duration is not None:
+                    log.info(f"✅ Reel {index} completed ({duration:.1f}s)")
+                    return {'file': output_file, 'title': title, 'duration': duration}
+            log.info("↩️  Falling back to MoviePy compositing")
+        
+        # Create the reel
+        created = self.create_single_reel(
+            background_video, content_item, **kwargs
+        )
+        
+        if not created:
+            log.error(f"❌ Failed to create reel {index}")
+            return None
+        reel_video, audio_file = created
+        
+        # Export video with error handling
+        log.info(f"💾 Exporting: {output_file.name}")
+        reel = None
+        try:
+            preset, ffmpeg_params = encoder_settings(self.encoder, quality=23, fast=True)
+            # MoviePy only writes the video; the voice-over is then muxed in by
+            # ffmpeg with a single AAC encode and the video stream copied
+            video_file = (self.temp_folder / f"{output_file.stem}_video.mp4"
+                          if audio_file else output_file)
+            reel_video.write_videofile(
+                str(video_file),
+                fps=REEL_FPS,
+                codec=self.encoder,
+                audio=False,
+                preset=preset,
+                ffmpeg_params=ffmpeg_params,
+                verbose=False,
+                logger=None
+            )
+            if audio_file:
+                run_ffmpeg(['-i', str(video_file), '-i', str(audio_file),
+                            '-map', '0:v', '-map', '1:a', '-c:v', 'copy', '-c:a', 'aac',
+                            '-shortest', '-movflags', '+faststart', str(output_file)])
+                video_file.unlink()
+            
+            reel = {
+                'file': output_file,
+                'title': title,
+                'duration': reel_video.duration
+            }
+            
+            log.info(f"✅ Reel {index} completed ({reel_video.duration:.1f}s)")
+            
+        except Exception as e:
+            log.error(f"❌ Export failed for reel {index}: {e}")
+        
+        # Cleanup
+        try:
+            reel_video.close()
+        except:
+            pass
         
-        return created_reels
+        return reel
     
     def cleanup(self):
         """Clean up temporary files"""
+        for clip in self._background_clips.values():
+            clip.close()
+        self._background_clips.clear()
+        
+        if not self.temp_folder.exists():
+            return
         try:
-            if self.temp_folder.exists():
-                shutil.rmtree(self.temp_folder)
-                print("🧹 Cleaned up temporary files")
+            shutil.rmtree(self.temp_folder)
+            log.info("🧹 Cleaned up temporary files")
+        except PermissionError:
+            # Windows refuses to delete files another process still has open;
+            # remove everything else instead of stopping at the first one
+            shutil.rmtree(self.temp_folder, ignore_errors=True)
+            log.warning(f"⚠️  Cleanup warning: files still in use were left in {self.temp_folder}")
         except Exception as e:
-            print(f"⚠️  Cleanup warning: {e}")
+            log.warning(f"⚠️  Cleanup warning: {e}")
+    
+    def __enter__(self):
+        return self
     
-    def __del__(self):
-        """Ensure cleanup on object destruction"""
+    def __exit__(self, exc_type, exc, tb):
         self.cleanup()
 
+# Per-process creator used by create_batch_reels' worker pool
+_worker_creator = None
+
+def _init_reel_worker(output_folder, tts_cache_folder, temp_dir, hwaccel, encoder, torch_threads,
+                      log_level):
+    """Pool initializer: build one creator per worker process"""
+    global _worker_creator
+    # Spawned workers start without logging set up; report at the parent's level
+    logging.basicConfig(level=log_level, format='%(message)s', stream=sys.stdout)
+    # Temp files go under the parent's temp folder, so its cleanup removes them
+    _worker_creator = InstagramReelCreator(output_folder, tts_cache_folder=tts_cache_folder,
+                                           temp_dir=temp_dir, hwaccel=hwaccel, encoder=encoder,
+                                           torch_threads=torch_threads)
+
+def _render_with(creator, spec):
+    """Unpack a create_batch_reels spec and render it with creator"""
+    index, num_reels, background_video, content_item, kwargs = spec
+    return creator.render_reel(index, num_reels, background_video, content_item, **kwargs)
+
+def _render_single_reel(spec):
+    """Render one reel spec in a pool worker"""
+    return _render_with(_worker_creator, spec)
+
 def main():
     """Main CLI function"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     parser = argparse.ArgumentParser(
         description="Create Instagram Reels with Kokoro TTS",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -550,82 +1178,84 @@ Examples:
                        help="List available voices and exit")
     parser.add_argument("--output", "-o", default="instagram_reels",
                        help="Output folder (default: instagram_reels)")
+    parser.add_argument("--hwaccel", choices=['cuda'], default=None,
+                       help="Composite fade-animated reels on an NVIDIA GPU")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                       help="Reels rendered in parallel (default: half the CPU cores)")
     
     args = parser.parse_args()
     
+    # List voices if requested; a constant list, so no creator is needed
+    if args.list_voices:
+        InstagramReelCreator.list_voices()
+        return 0
+    
     try:
-        # Initialize creator
-        creator = InstagramReelCreator(args.output)
-        
-        # List voices if requested
-        if args.list_voices:
-            creator.list_voices()
+        # Initialize creator; leaving the block removes its temp files
+        with InstagramReelCreator(args.output, hwaccel=args.hwaccel) as creator:
+            
+            # Validate required arguments
+            if not args.background or not args.content:
+                print("❌ Error: --background and --content are required")
+                print("Use --help for more information")
+                return 1
+            
+            if not Path(args.background).exists():
+                print(f"❌ Error: Background video not found: {args.background}")
+                return 1
+            
+            if not Path(args.content).exists():
+                print(f"❌ Error: Content file not found: {args.content}")
+                return 1
+            
+            # Show configuration
+            print("🎬 Instagram Reel Creator")
+            print("=" * 50)
+            print(f"Background Video: {args.background}")
+            print(f"Content File: {args.content}")
+            print(f"Number of Reels: {args.num_reels}")
+            print(f"Voice: {args.voice}")
+            print(f"Voice Speed: {args.voice_speed}x")
+            print(f"Text Style: {args.style}")
+            print(f"Animation: {args.animation}")
+            print(f"Max Duration: {args.max_duration}s")
+            print(f"Output Folder: {args.output}")
+            print("=" * 50)
+            
+            # Create reels
+            start_time = time.time()
+            
+            created_reels = creator.create_batch_reels(
+                background_video=args.background,
+                content_file=args.content,
+                num_reels=args.num_reels,
+                workers=args.workers,
+                voice=args.voice,
+                voice_speed=args.voice_speed,
+                style=args.style,
+                animation=args.animation,
+                max_duration=args.max_duration
+            )
+            
+            # Summary
+            elapsed_time = time.time() - start_time
+            total_duration = sum(reel['duration'] for reel in created_reels)
+            
+            print("\n" + "=" * 50)
+            print("🎉 SUMMARY")
+            print("=" * 50)
+            print(f"✅ Successfully created {len(created_reels)} reels")
+            print(f"⏱️  Processing time: {elapsed_time:.1f}s")
+            print(f"🎬 Total video duration: {total_duration:.1f}s")
+            print(f"📁 Output folder: {creator.output_folder}")
+            
+            if created_reels:
+                print("\nCreated Files:")
+                for reel in created_reels:
+                    print(f"  📹 {reel['file'].name} ({reel['duration']:.1f}s)")
+            
             return 0
         
-        # Validate required arguments
-        if not args.background or not args.content:
-            print("❌ Error: --background and --content are required")
-            print("Use --help for more information")
-            return 1
-        
-        if not Path(args.background).exists():
-            print(f"❌ Error: Background video not found: {args.background}")
-            return 1
-        
-        if not Path(args.content).exists():
-            print(f"❌ Error: Content file not found: {args.content}")
-            return 1
-        
-        # Show configuration
-        print("🎬 Instagram Reel Creator")
-        print("=" * 50)
-        print(f"Background Video: {args.background}")
-        print(f"Content File: {args.content}")
-        print(f"Number of Reels: {args.num_reels}")
-        print(f"Voice: {args.voice}")
-        print(f"Voice Speed: {args.voice_speed}x")
-        print(f"Text Style: {args.style}")
-        print(f"Animation: {args.animation}")
-        print(f"Max Duration: {args.max_duration}s")
-        print(f"Output Folder: {args.output}")
-        print("=" * 50)
-        
-        # Create reels
-        start_time = time.time()
-        
-        created_reels = creator.create_batch_reels(
-            background_video=args.background,
-            content_file=args.content,
-            num_reels=args.num_reels,
-            voice=args.voice,
-            voice_speed=args.voice_speed,
-            style=args.style,
-            animation=args.animation,
-            max_duration=args.max_duration
-        )
-        
-        # Summary
-        elapsed_time = time.time() - start_time
-        total_duration = sum(reel['duration'] for reel in created_reels)
-        
-        print("\n" + "=" * 50)
-        print("🎉 SUMMARY")
-        print("=" * 50)
-        print(f"✅ Successfully created {len(created_reels)} reels")
-        print(f"⏱️  Processing time: {elapsed_time:.1f}s")
-        print(f"🎬 Total video duration: {total_duration:.1f}s")
-        print(f"📁 Output folder: {creator.output_folder}")
-        
-        if created_reels:
-            print("\nCreated Files:")
-            for reel in created_reels:
-                print(f"  📹 {reel['file'].name} ({reel['duration']:.1f}s)")
-        
-        # Cleanup
-        creator.cleanup()
-        
-        return 0
-        
     except KeyboardInterrupt:
         print("\n⚠️  Process interrupted by user")
         return 1